@@ -0,0 +1,167 @@
+"""Benchmark the stages of the termtables rendering pipeline.
+
+Run from the repository root with
+
+    python benchmarks/benchmark.py [--rows 10000] [--repeat 3] [scenario ...]
+
+For every scenario, each stage is timed separately (best of `--repeat` runs) and its
+peak memory is measured in an extra run with tracemalloc. The stages are run on the
+output of the previous one, just like to_string() does.
+"""
+
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import termtables as tt  # noqa: E402
+from termtables import main  # noqa: E402
+
+
+def _scenarios(num_rows):
+    colors = ["\033[31m{}\033[0m", "\033[1m\033[32m{}\033[0m", "{}"]
+    return {
+        "plain": (
+            [[k, f"row {k}", k / 7, "x" * (k % 13)] for k in range(num_rows)],
+            {},
+        ),
+        "wide": ([[k * j for j in range(50)] for k in range(num_rows // 10)], {}),
+        "multiline": (
+            [[f"{k}\nline 2", f"row {k}\n{k / 7}"] for k in range(num_rows)],
+            {},
+        ),
+        "ansi": (
+            [
+                [colors[(k + j) % 3].format(k * j) for j in range(4)]
+                for k in range(num_rows)
+            ],
+            {},
+        ),
+        "padding": (
+            [[k, f"row {k}", k / 7] for k in range(num_rows)],
+            {"padding": (1, 2, 1, 2)},
+        ),
+        "blocks": (
+            [
+                [[k, f"row {k}", k / 7] for k in range(b, b + 100)]
+                for b in range(0, num_rows, 100)
+            ],
+            {},
+        ),
+    }
+
+
+def _stages(data, kwargs):
+    """The rendering pipeline, split into stages. Each stage gets the output of the
+    previous ones.
+    """
+    padding = main._create_padding_tuple(kwargs.get("padding", (0, 1)))
+    style = kwargs.get("style", tt.styles.thin_double)
+
+    def stringify(state):
+        state["strings"], state["num_columns"] = main._get_strings(data, None)
+
+    def cell_widths(state):
+        state["cell_widths"] = main._get_cell_widths(state["strings"])
+
+    def column_widths(state):
+        state["column_widths"] = main._get_column_widths(
+            state["cell_widths"], state["num_columns"]
+        )
+        state["template"] = tt.Template(
+            state["column_widths"], "l", padding, style, overflow="wrap"
+        )
+
+    def render_rows(state):
+        # overflow, splitting of multiline cells, alignment, padding (including the
+        # padding rows), vertical borders, and skipping blank lines; as in to_string()
+        t = state["template"]
+        state["rows"] = [
+            [t._render_row(row, widths) for row, widths in zip(block, block_widths)]
+            for block, block_widths in zip(state["strings"], state["cell_widths"])
+        ]
+
+    def assemble_borders(state):
+        state["out"] = "\n".join(state["template"]._join(state["rows"]))
+
+    return [
+        stringify,
+        cell_widths,
+        column_widths,
+        render_rows,
+        assemble_borders,
+    ]
+
+
+def _run(stages):
+    state = {}
+    times = []
+    for stage in stages:
+        start = time.perf_counter()
+        stage(state)
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def _run_traced(stages):
+    state = {}
+    peaks = []
+    for stage in stages:
+        tracemalloc.start()
+        stage(state)
+        peaks.append(tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+    return peaks
+
+
+def _time_total(data, kwargs, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        tt.to_string(data, **kwargs)
+        best = min(best, time.perf_counter() - start)
+    tracemalloc.start()
+    tt.to_string(data, **kwargs)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return best, peak
+
+
+def run(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("scenarios", nargs="*", help="scenarios to run (default: all)")
+    parser.add_argument("--rows", type=int, default=10000, help="number of rows")
+    parser.add_argument("--repeat", type=int, default=3, help="number of runs")
+    args = parser.parse_args(argv)
+
+    scenarios = _scenarios(args.rows)
+    names = args.scenarios or list(scenarios)
+
+    for name in names:
+        data, kwargs = scenarios[name]
+        stages = _stages(data, kwargs)
+
+        times = [min(t) for t in zip(*[_run(stages) for _ in range(args.repeat)])]
+        peaks = _run_traced(stages)
+        total_time, total_peak = _time_total(data, kwargs, args.repeat)
+
+        rows = [
+            [stage.__name__, f"{1000 * t:.1f}", f"{p / 2 ** 20:.1f}"]
+            for stage, t, p in zip(stages, times, peaks)
+        ]
+        rows.append(
+            ["to_string", f"{1000 * total_time:.1f}", f"{total_peak / 2 ** 20:.1f}"]
+        )
+        tt.print(
+            rows,
+            header=[name, "time [ms]", "peak [MiB]"],
+            alignment="lrr",
+            style=tt.styles.thin_thick,
+        )
+
+
+if __name__ == "__main__":
+    run()
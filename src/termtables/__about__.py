@@ -1,10 +1,28 @@
-try:
-    # Python 3.8
-    from importlib import metadata
-except ImportError:
-    import importlib_metadata as metadata
-
-try:
-    __version__ = metadata.version("termtables")
-except Exception:
-    __version__ = "unknown"
+import sys
+
+
+def get_version():
+    # Looking up the distribution is slow, so this only happens on demand.
+    try:
+        # Python 3.8
+        from importlib import metadata
+    except ImportError:
+        import importlib_metadata as metadata
+
+    try:
+        return metadata.version("termtables")
+    except Exception:
+        return "unknown"
+
+
+def __getattr__(name):
+    # `__about__.__version__` as before, only looked up when it's asked for
+    if name == "__version__":
+        version = globals()["__version__"] = get_version()
+        return version
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+if sys.version_info < (3, 7):
+    # no module __getattr__
+    __version__ = get_version()
@@ -1,8 +1,51 @@
-from .__about__ import __version__
-from .main import print, to_string
+import sys
+
+from .aio import lines_async, to_string_async, write_async
+from .backends import render
+from .instrumentation import profile
+from .live import LiveTable
+from .main import (
+    StickyWidths,
+    Template,
+    pages,
+    prepare,
+    print,
+    stream,
+    to_string,
+    write,
+)
 
 __all__ = [
     "__version__",
+    "LiveTable",
+    "StickyWidths",
+    "Template",
+    "lines_async",
+    "pages",
+    "prepare",
     "print",
+    "profile",
+    "render",
+    "stream",
     "to_string",
+    "to_string_async",
+    "write",
+    "write_async",
 ]
+
+
+def __getattr__(name):
+    # The version is only looked up when it's asked for, see PEP 562.
+    if name == "__version__":
+        from .__about__ import get_version
+
+        version = globals()["__version__"] = get_version()
+        return version
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+if sys.version_info < (3, 7):
+    # no module __getattr__
+    from .__about__ import get_version
+
+    __version__ = get_version()
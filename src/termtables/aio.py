@@ -0,0 +1,85 @@
+"""Rendering in asyncio applications without blocking the event loop.
+
+The lines come from the same stages as those of `to_string()` and `write()`, so the
+output is identical. They are produced in chunks: for small tables in the event
+loop, which gets control back between the chunks; for large tables, everything
+including the measurement runs in the default executor.
+"""
+
+import functools
+import itertools
+
+from .main import Cells, _get_columns, _get_lines
+
+# Tables with at least this many rows are rendered in the executor.
+threshold = 2000
+# number of lines per chunk
+chunk_size = 500
+
+
+def _num_rows(data):
+    if isinstance(data, Cells):
+        num_rows = sum(len(block) for block in data.strings)
+        if data.numeric_columns is not None:
+            num_rows += len(data.numeric_columns[0][0])
+        return num_rows
+    columns = _get_columns(data)
+    if columns is not None:
+        return len(columns[1][0]) if columns[1] else 0
+    try:
+        return len(data)
+    except TypeError:
+        # unknown size, better safe than sorry
+        return threshold
+
+
+def _take(lines):
+    return list(itertools.islice(lines, chunk_size))
+
+
+async def _chunks(data, header, kwargs):
+    import asyncio
+
+    if _num_rows(data) < threshold:
+        lines = _get_lines(data, header, **kwargs)
+        chunk = _take(lines)
+        while chunk:
+            yield chunk
+            await asyncio.sleep(0)
+            chunk = _take(lines)
+        return
+
+    loop = asyncio.get_event_loop()
+    get_lines = functools.partial(_get_lines, data, header, **kwargs)
+    lines = await loop.run_in_executor(None, get_lines)
+    chunk = await loop.run_in_executor(None, _take, lines)
+    while chunk:
+        yield chunk
+        chunk = await loop.run_in_executor(None, _take, lines)
+
+
+async def lines_async(data, header=None, **kwargs):
+    """Asynchronous generator over the lines of the table. The keyword arguments are
+    those of `to_string()`.
+    """
+    async for chunk in _chunks(data, header, kwargs):
+        for line in chunk:
+            yield line
+
+
+async def to_string_async(data, header=None, **kwargs):
+    """Same as `to_string()`, but lets other tasks run while rendering."""
+    lines = []
+    async for chunk in _chunks(data, header, kwargs):
+        lines.extend(chunk)
+    return "\n".join(lines)
+
+
+async def write_async(data, writer, header=None, encoding="utf-8", **kwargs):
+    """Write the table to an `asyncio.StreamWriter` (or anything with `write()` and
+    `drain()`), encoded with `encoding`, waiting for it to drain after every chunk of
+    lines. The output is the same as that of `write()`.
+    """
+    async for chunk in _chunks(data, header, kwargs):
+        writer.write(("\n".join(chunk) + "\n").encode(encoding))
+        await writer.drain()
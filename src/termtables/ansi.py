@@ -0,0 +1,141 @@
+"""Colors and text attributes of cells.
+
+The attributes are applied while the lines are rendered, after the cells have been
+measured as plain text, so no escape sequences need to be removed for measuring and
+malformed ones can't throw off the alignment.
+"""
+
+_colors = {
+    "black": 0,
+    "red": 1,
+    "green": 2,
+    "yellow": 3,
+    "blue": 4,
+    "magenta": 5,
+    "cyan": 6,
+    "white": 7,
+}
+
+_reset = "\x1b[0m"
+
+
+def _color_code(color, base):
+    """SGR parameters of a color, `base` is 30 for the foreground, 40 for the
+    background
+    """
+    if isinstance(color, str):
+        if color.startswith("bright_"):
+            return str(base + 60 + _colors[color[7:]])
+        return str(base + _colors[color])
+    if isinstance(color, int):
+        assert 0 <= color < 256
+        return f"{base + 8};5;{color}"
+    assert len(color) == 3
+    assert all(0 <= c < 256 for c in color)
+    return f"{base + 8};2;" + ";".join(str(c) for c in color)
+
+
+class Attributes:
+    """Colors and text attributes of cells. `fg` and `bg` are color names like "red"
+    or "bright_red", numbers from the 256-color palette, or (r, g, b) tuples. Fields
+    that are `None` are left as they are when attributes are combined.
+    """
+
+    _fields = ("fg", "bg", "bold", "dim", "italic", "underline")
+    __slots__ = _fields + ("code",)
+
+    def __init__(
+        self, fg=None, bg=None, bold=None, dim=None, italic=None, underline=None
+    ):
+        self.fg = fg
+        self.bg = bg
+        self.bold = bold
+        self.dim = dim
+        self.italic = italic
+        self.underline = underline
+
+        params = []
+        for flag, param in [(bold, "1"), (dim, "2"), (italic, "3"), (underline, "4")]:
+            if flag:
+                params.append(param)
+        if fg is not None:
+            params.append(_color_code(fg, 30))
+        if bg is not None:
+            params.append(_color_code(bg, 40))
+        # the escape sequence that switches the attributes on
+        self.code = "\x1b[" + ";".join(params) + "m" if params else ""
+
+    def merge(self, other):
+        """These attributes, overridden by those of `other` that aren't `None`"""
+        if other is None:
+            return self
+        kwargs = {name: getattr(self, name) for name in self._fields}
+        for name in self._fields:
+            value = getattr(other, name)
+            if value is not None:
+                kwargs[name] = value
+        return Attributes(**kwargs)
+
+    def _key(self):
+        return tuple(getattr(self, name) for name in self._fields)
+
+    def __eq__(self, other):
+        return isinstance(other, Attributes) and self._key() == other._key()
+
+    def __hash__(self):
+        return hash(self._key())
+
+    def __repr__(self):
+        args = ", ".join(
+            f"{name}={getattr(self, name)!r}"
+            for name in self._fields
+            if getattr(self, name) is not None
+        )
+        return f"Attributes({args})"
+
+
+def _get_painter(columns, rows, cells, num_columns):
+    """Function that returns the escape codes of the cells of a row, given the index
+    of the row and its strings, or `None` if no attributes are set. See `to_string()`
+    for the arguments.
+    """
+    if columns is None and rows is None and cells is None:
+        return None
+
+    if columns is None or isinstance(columns, Attributes):
+        columns = num_columns * [columns]
+    assert len(columns) == num_columns
+    columns = [Attributes() if attrs is None else attrs for attrs in columns]
+
+    if rows is None:
+        rows = [None]
+    if callable(rows):
+        # the codes of a row only depend on its attributes
+        cache = {}
+
+        def get_row(i):
+            attrs = rows(i)
+            if attrs not in cache:
+                cache[attrs] = [col.merge(attrs).code for col in columns]
+            return attrs, cache[attrs]
+
+    else:
+        # in turn, e.g., for zebra stripes
+        rows = [(attrs, [col.merge(attrs).code for col in columns]) for attrs in rows]
+
+        def get_row(i):
+            return rows[i % len(rows)]
+
+    if cells is None:
+        return lambda i, row: get_row(i)[1]
+
+    def paint(i, row):
+        attrs, codes = get_row(i)
+        codes = list(codes)
+        for j, item in enumerate(row):
+            cell_attrs = cells(i, j, item)
+            if cell_attrs is not None:
+                codes[j] = columns[j].merge(attrs).merge(cell_attrs).code
+        return codes
+
+    return paint
@@ -0,0 +1,282 @@
+"""Output formats that all render from the same formatted and measured cells.
+
+A backend turns the `Cells` from `prepare()` into lines of text. The data is
+converted once, no matter how many formats it's rendered to:
+
+    cells = tt.prepare(data, header, alignment="lrd", formats=[None, ",", ".2f"])
+    tt.print(cells)
+    markdown = tt.render(cells, "markdown")
+    html = tt.render(cells, "html")
+"""
+
+import io
+import itertools
+
+from . import styles
+from .main import (
+    Cells,
+    Template,
+    _display_width,
+    _get_layout,
+    _get_limits,
+    _remove_escape_sequences,
+    _render,
+    prepare,
+)
+
+
+class Backend:
+    """Base class of all backends. Subclasses implement `lines()`."""
+
+    def lines(self, cells):
+        """Generator over the lines of the rendered `cells`."""
+        raise NotImplementedError
+
+    def to_string(self, cells):
+        return "\n".join(self.lines(cells))
+
+
+def _plain(string):
+    """The text of a cell without escape sequences"""
+    return _remove_escape_sequences(string) if "\x1b" in string else string
+
+
+def _get_rows(cells, escape, decimal_padding=False):
+    """The escaped header and rows of `cells`, their widths, and the column widths.
+    Only the cells that escaping changes are measured again. Unless
+    `decimal_padding`, the spaces that line up decimal points are removed.
+    """
+    strip = [not decimal_padding and align == "d" for align in cells.alignments]
+    column_widths = list(cells.column_widths)
+
+    def convert(row, row_widths):
+        out = []
+        out_widths = []
+        for j, (item, width) in enumerate(zip(row, row_widths)):
+            new = escape(_plain(item.strip() if strip[j] else item))
+            if new != item:
+                width = _display_width(new)
+                column_widths[j] = max(column_widths[j], width)
+            out.append(new)
+            out_widths.append(width)
+        return out, out_widths
+
+    header = (
+        None if cells.header is None else convert(cells.header, cells.header_widths)
+    )
+    blocks = [[convert(*row) for row in block] for block in cells.blocks()]
+    return header, blocks, column_widths
+
+
+class Terminal(Backend):
+    """The regular tables for the terminal, see `to_string()` for the arguments."""
+
+    def __init__(
+        self,
+        padding=(0, 1),
+        style=styles.thin_double,
+        vertical_alignment="t",
+        keep_empty_rows=False,
+        max_width=None,
+        min_widths=None,
+        max_widths=None,
+        overflow="wrap",
+    ):
+        self.padding = padding
+        self.style = style
+        self.vertical_alignment = vertical_alignment
+        self.keep_empty_rows = keep_empty_rows
+        self.overflow = overflow
+        self.limits = _get_limits(max_width, min_widths, max_widths)
+
+    def lines(self, cells):
+        layout = _get_layout(
+            cells.alignments,
+            self.padding,
+            self.style,
+            self.vertical_alignment,
+            self.keep_empty_rows,
+            self.overflow,
+        )
+        return _render(cells, None, layout, limits=self.limits)
+
+
+def _escape_markdown(string):
+    return string.replace("|", "\\|").replace("\n", "<br>")
+
+
+class Markdown(Backend):
+    """Markdown tables with alignment markers. Markdown needs a header row, so
+    tables without one get an empty header. Decimal ("d") columns are marked as
+    right-aligned, and the decimal points of their cells are lined up with spaces,
+    which the renderers usually collapse.
+    """
+
+    _markers = {"l": ":-{}", "c": ":{}:", "r": "{}-:", "d": "{}-:"}
+
+    def lines(self, cells):
+        header, blocks, widths = _get_rows(cells, _escape_markdown, True)
+        # the separator line needs at least three characters per column
+        widths = [max(w, 1) for w in widths]
+        template = Template(
+            widths, cells.alignments, (0, 1), styles.markdown, keep_empty_rows=True
+        )
+        if header is None:
+            header = (len(widths) * [""], len(widths) * [0])
+        yield template._render_line(*header)
+        yield "|" + "|".join(
+            self._markers[align].format("-" * w)
+            for align, w in zip(cells.alignments, widths)
+        ) + "|"
+        for block in blocks:
+            for row in block:
+                yield template._render_line(*row)
+
+
+def _escape_html(string):
+    import html
+
+    return html.escape(string).replace("\n", "<br>")
+
+
+class HTML(Backend):
+    """HTML tables, the header in `<thead>` and every block in a `<tbody>` of its
+    own. The alignment is set per cell with `text-align`; decimal ("d") columns
+    are right-aligned, their decimal points aren't lined up.
+    """
+
+    _styles = {
+        "l": "",
+        "c": ' style="text-align: center"',
+        "r": ' style="text-align: right"',
+        "d": ' style="text-align: right"',
+    }
+
+    def lines(self, cells):
+        header, blocks, _ = _get_rows(cells, _escape_html)
+        attrs = [self._styles[align] for align in cells.alignments]
+
+        def tr(row, tag):
+            return (
+                "<tr>"
+                + "".join(
+                    f"<{tag}{attr}>{item}</{tag}>" for item, attr in zip(row, attrs)
+                )
+                + "</tr>"
+            )
+
+        yield "<table>"
+        if header is not None:
+            yield "<thead>"
+            yield tr(header[0], "th")
+            yield "</thead>"
+        for block in blocks:
+            yield "<tbody>"
+            for row, _ in block:
+                yield tr(row, "td")
+            yield "</tbody>"
+        yield "</table>"
+
+
+class CSV(Backend):
+    """Comma-separated values (or any other `delimiter`) with the header in the
+    first row. Cells with line breaks span several lines, quoted.
+    """
+
+    def __init__(self, delimiter=","):
+        self.delimiter = delimiter
+
+    def lines(self, cells):
+        import csv
+
+        header, blocks, _ = _get_rows(cells, str)
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, delimiter=self.delimiter, lineterminator="")
+
+        rows = (row for block in blocks for row, _ in block)
+        if header is not None:
+            rows = itertools.chain([header[0]], rows)
+        for row in rows:
+            buffer.seek(0)
+            buffer.truncate()
+            writer.writerow(row)
+            yield buffer.getvalue()
+
+
+_latex_specials = {
+    "\\": r"\textbackslash{}",
+    "&": r"\&",
+    "%": r"\%",
+    "$": r"\$",
+    "#": r"\#",
+    "_": r"\_",
+    "{": r"\{",
+    "}": r"\}",
+    "~": r"\textasciitilde{}",
+    "^": r"\textasciicircum{}",
+}
+
+
+def _escape_latex(string):
+    if any(char in string for char in _latex_specials):
+        string = "".join(_latex_specials.get(char, char) for char in string)
+    # there are no line breaks in simple columns
+    return string.replace("\n", " ")
+
+
+class LaTeX(Backend):
+    """A LaTeX `tabular` with horizontal rules around the header and the blocks.
+    Decimal ("d") columns are right-aligned `r` columns, so their decimal points
+    aren't lined up in the typeset table.
+    """
+
+    _columns = {"l": "l", "c": "c", "r": "r", "d": "r"}
+    # only the separators of the cells and the line ends are used
+    _verticals = styles.Style(" ", "&", *9 * " ", left="", right="\\\\")
+
+    def lines(self, cells):
+        header, blocks, widths = _get_rows(cells, _escape_latex, True)
+        template = Template(widths, cells.alignments, (0, 1), self._verticals)
+
+        spec = "".join(self._columns[align] for align in cells.alignments)
+        yield "\\begin{tabular}{" + spec + "}"
+        yield "\\hline"
+        if header is not None:
+            yield template._render_line(*header)
+            yield "\\hline"
+        for block in blocks:
+            for row in block:
+                yield template._render_line(*row)
+            yield "\\hline"
+        yield "\\end{tabular}"
+
+
+_registry = {
+    "terminal": Terminal,
+    "markdown": Markdown,
+    "html": HTML,
+    "csv": CSV,
+    "latex": LaTeX,
+}
+
+
+def register(name, backend):
+    """Make a `Backend` subclass available by name in `render()`."""
+    _registry[name] = backend
+
+
+def render(
+    data, backend="terminal", header=None, alignment="l", formats=None, **kwargs
+):
+    """Render a table with a backend, given by name or as a `Backend` instance.
+    `kwargs` are passed on to the backend class. `data` is either the `Cells` from
+    `prepare()`, or anything `to_string()` accepts; then, it is prepared with
+    `header`, `alignment`, and `formats` first. Only the terminal backend lines up the
+    decimal points of "d" columns; Markdown, HTML, and LaTeX right-align those
+    columns instead, and CSV has no alignment.
+    """
+    if not isinstance(data, Cells):
+        data = prepare(data, header, alignment, formats)
+    if isinstance(backend, str):
+        backend = _registry[backend](**kwargs)
+    return backend.to_string(data)
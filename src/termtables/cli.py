@@ -0,0 +1,272 @@
+"""Command-line interface: tables from CSV, TSV, or JSON Lines.
+
+The input is read and rendered row by row with `stream()`, so only the rows that
+determine the column widths are ever held in memory.
+"""
+
+import argparse
+import csv
+import itertools
+import json
+import os
+import sys
+
+from . import styles
+from .main import _write_lines, stream
+
+_style_names = list(styles._registry)
+
+
+def _get_format(args):
+    if args.format is not None:
+        return args.format
+    ext = os.path.splitext(args.file or "")[1].lower()
+    if ext == ".tsv":
+        return "tsv"
+    if ext in [".jsonl", ".ndjson"]:
+        return "jsonl"
+    return "csv"
+
+
+def _read_delimited(file, delimiter, header):
+    """The header (or `None`) and an iterator over the rows"""
+    if header == "auto":
+        # check the first lines, then put them back in front of the rest
+        sample = list(itertools.islice(file, 20))
+        try:
+            has_header = csv.Sniffer().has_header("".join(sample))
+        except csv.Error:
+            has_header = False
+        file = itertools.chain(sample, file)
+    else:
+        has_header = header == "yes"
+
+    rows = (row for row in csv.reader(file, delimiter=delimiter) if row)
+    return (next(rows, None) if has_header else None), rows
+
+
+def _json_str(value):
+    if isinstance(value, str):
+        return value
+    # true, false, null, and nested values as in the input
+    return json.dumps(value, ensure_ascii=False)
+
+
+def _parse_json_lines(file):
+    """Iterator over the line numbers and values of the non-empty lines"""
+    for k, line in enumerate(file):
+        if not line.strip():
+            continue
+        try:
+            yield k + 1, json.loads(line)
+        except json.JSONDecodeError as e:
+            raise SystemExit(f"termtables: line {k + 1} is not valid JSON: {e.msg}")
+
+
+def _read_json_lines(file, header):
+    """Every line is either an object, whose keys make up the header, or an array.
+    All lines must be of the same kind, and the objects can't have keys that the
+    first one doesn't have.
+    """
+    values = _parse_json_lines(file)
+    first = next(values, None)
+    if first is None:
+        return None, iter([])
+    values = itertools.chain([first], values)
+
+    if isinstance(first[1], dict):
+        keys = list(first[1])
+
+        def get_rows():
+            for k, obj in values:
+                if not isinstance(obj, dict):
+                    raise SystemExit(f"termtables: line {k} is not an object")
+                unknown = [key for key in obj if key not in keys]
+                if unknown:
+                    raise SystemExit(
+                        f"termtables: line {k} has the key {unknown[0]!r}, "
+                        "which the first object doesn't have"
+                    )
+                yield [_json_str(obj.get(key, "")) for key in keys]
+
+        return (None if header == "no" else keys), get_rows()
+
+    def get_rows():
+        for k, row in values:
+            if not isinstance(row, list):
+                raise SystemExit(f"termtables: line {k} is not an array")
+            yield [_json_str(value) for value in row]
+
+    rows = get_rows()
+    if header == "yes":
+        return next(rows), rows
+    return None, rows
+
+
+def _check_lengths(header, rows):
+    """Pad short rows with empty cells; rows that are too long are an error."""
+    num_columns = None if header is None else len(header)
+    for k, row in enumerate(rows):
+        if num_columns is None:
+            num_columns = len(row)
+        if len(row) > num_columns:
+            raise SystemExit(
+                f"termtables: row {k + 1} has {len(row)} fields, expected {num_columns}"
+            )
+        yield row + (num_columns - len(row)) * [""]
+
+
+def _parse_ints(string):
+    values = [int(value) for value in string.replace(",", " ").split()]
+    return values[0] if len(values) == 1 else values
+
+
+def _parse_sample_rows(string):
+    try:
+        value = int(string)
+    except ValueError:
+        value = 0
+    if value < 1:
+        raise argparse.ArgumentTypeError(
+            f"invalid number of rows {string!r}, expected a positive integer"
+        )
+    return value
+
+
+def _parse_alignment(string):
+    if not string or any(align not in "lcr" for align in string):
+        raise argparse.ArgumentTypeError(
+            f'invalid alignment {string!r}, expected "l", "c", or "r" per column'
+        )
+    return string
+
+
+def _get_num_columns(header, rows):
+    """The number of columns (or `None` for no input) and the rows"""
+    if header is not None:
+        return len(header), rows
+    first = next(rows, None)
+    if first is None:
+        return None, rows
+    return len(first), itertools.chain([first], rows)
+
+
+def _get_parser():
+    parser = argparse.ArgumentParser(
+        prog="termtables",
+        description="Pretty tables from CSV, TSV, or JSON Lines in the terminal.",
+    )
+    parser.add_argument("file", nargs="?", help="input file (default: stdin)")
+    parser.add_argument(
+        "-f",
+        "--format",
+        choices=["csv", "tsv", "jsonl"],
+        help="input format (default: from the file extension, else csv)",
+    )
+    parser.add_argument(
+        "--header",
+        choices=["auto", "yes", "no"],
+        default="auto",
+        help="whether the first row is the header (default: %(default)s)",
+    )
+    parser.add_argument(
+        "-s",
+        "--style",
+        choices=_style_names + ["none"],
+        default="thin_double",
+        help="border style (default: %(default)s)",
+    )
+    parser.add_argument(
+        "-a",
+        "--alignment",
+        type=_parse_alignment,
+        default="l",
+        help='"l", "c", or "r" for all columns or one per column, e.g., "lrr"',
+    )
+    parser.add_argument(
+        "-p",
+        "--padding",
+        type=_parse_ints,
+        default=(0, 1),
+        help='1 to 4 numbers like in CSS, e.g., "0,1" (default)',
+    )
+    parser.add_argument(
+        "-w",
+        "--column-widths",
+        type=_parse_ints,
+        help="fixed column widths, e.g., 10,5,20; no rows are held in memory",
+    )
+    parser.add_argument(
+        "-n",
+        "--sample-rows",
+        type=_parse_sample_rows,
+        default=100,
+        help="number of rows the column widths are taken from (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--overflow",
+        choices=["wrap", "truncate"],
+        help="what to do with cells wider than their column (default: overflow it)",
+    )
+    return parser
+
+
+def main(argv=None):
+    parser = _get_parser()
+    args = parser.parse_args(argv)
+
+    fmt = _get_format(args)
+    style = None if args.style == "none" else styles.get(args.style)
+    column_widths = args.column_widths
+    if isinstance(column_widths, int):
+        column_widths = [column_widths]
+
+    if args.file is None:
+        file = sys.stdin
+    else:
+        try:
+            file = open(args.file, newline="", encoding="utf-8")
+        except OSError as e:
+            parser.error(f"can't open {args.file!r}: {e.strerror}")
+
+    try:
+        if fmt == "jsonl":
+            header, rows = _read_json_lines(file, args.header)
+        else:
+            delimiter = "\t" if fmt == "tsv" else ","
+            header, rows = _read_delimited(file, delimiter, args.header)
+
+        num_columns, rows = _get_num_columns(header, rows)
+        if num_columns is not None:
+            if len(args.alignment) not in [1, num_columns]:
+                parser.error(
+                    f"{len(args.alignment)} alignments given for {num_columns} columns"
+                )
+            if column_widths is not None and len(column_widths) != num_columns:
+                parser.error(
+                    f"{len(column_widths)} column widths given for {num_columns} columns"
+                )
+
+        lines = stream(
+            _check_lengths(header, rows),
+            header=header,
+            alignment=args.alignment,
+            padding=args.padding,
+            style=style,
+            column_widths=column_widths,
+            num_sample_rows=args.sample_rows,
+            overflow=args.overflow,
+        )
+        try:
+            _write_lines(lines)
+            sys.stdout.flush()
+        except BrokenPipeError:
+            # e.g., piped into `head`; see
+            # https://docs.python.org/3/library/signal.html#note-on-sigpipe
+            devnull = os.open(os.devnull, os.O_WRONLY)
+            os.dup2(devnull, sys.stdout.fileno())
+            return 1
+    finally:
+        if file is not sys.stdin:
+            file.close()
+    return 0
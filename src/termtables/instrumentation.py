@@ -0,0 +1,94 @@
+"""Opt-in instrumentation of the rendering pipeline.
+
+While a `profile()` is active, every call to `to_string()`, `write()`, and `print()`
+produces a `Record` with counters and the durations of the stages. Without an active
+profile, nothing is measured or counted.
+"""
+
+import time
+
+_profiles = []
+
+
+class Record:
+    """Counters and stage durations (in seconds) of one call. `bytes` is the UTF-8
+    size of all lines without line breaks.
+
+    The stages are "stringify" (formatting the cells), "measure" (the widths of the
+    cells and columns), and "render": fitting the columns into the limits, padding
+    and aligning the cells, drawing the borders, and joining (or writing) the lines.
+    """
+
+    def __init__(self, function):
+        self.function = function
+        self.durations = {}
+        self.cells = 0
+        self.ansi_cells = 0
+        self.lines = 0
+        self.bytes = 0
+        self._last = time.perf_counter()
+
+    def __repr__(self):
+        return (
+            f"Record({self.function!r}, cells={self.cells}, "
+            f"ansi_cells={self.ansi_cells}, lines={self.lines}, bytes={self.bytes}, "
+            f"durations={self.durations})"
+        )
+
+    def lap(self, stage):
+        """Attribute the time since the previous lap to `stage`."""
+        now = time.perf_counter()
+        self.durations[stage] = self.durations.get(stage, 0.0) + now - self._last
+        self._last = now
+
+    def count_cells(self, strings):
+        for string in strings:
+            self.cells += 1
+            if "\x1b" in string:
+                self.ansi_cells += 1
+
+    def count_lines(self, lines):
+        for line in lines:
+            self.lines += 1
+            self.bytes += len(line.encode("utf-8"))
+            yield line
+
+
+class Profile:
+    """Collects the records of all calls while active. If given, `callback` is called
+    with every record as soon as the call is finished, e.g., to feed them into a
+    metrics system.
+    """
+
+    def __init__(self, callback=None):
+        self.callback = callback
+        self.records = []
+
+    def __enter__(self):
+        _profiles.append(self)
+        return self
+
+    def __exit__(self, *exc_info):
+        _profiles.remove(self)
+
+    def _add(self, record):
+        self.records.append(record)
+        if self.callback is not None:
+            self.callback(record)
+
+
+def profile(callback=None):
+    """Context manager that profiles all calls within, see `Profile`."""
+    return Profile(callback)
+
+
+def start(function):
+    """A new record if a profile is active, `None` otherwise."""
+    if not _profiles:
+        return None
+    return Record(function)
+
+
+def finish(record):
+    for p in _profiles:
+        p._add(record)
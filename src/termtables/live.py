@@ -0,0 +1,85 @@
+import sys
+
+from . import styles
+from .main import StickyWidths, Template, _hashable, _measure
+
+
+def _move(from_row, to_row, num_rows_on_screen):
+    """ANSI sequence that moves the cursor from one row to another. Rows beyond those
+    already on the screen are created with newlines.
+    """
+    if to_row < from_row:
+        return f"\x1b[{from_row - to_row}A"
+    out = ""
+    down = min(to_row, num_rows_on_screen - 1) - from_row
+    if down > 0:
+        out += f"\x1b[{down}B"
+    if to_row >= num_rows_on_screen:
+        out += "\n" * (to_row - max(from_row, num_rows_on_screen - 1))
+    return out
+
+
+def _diff(old, new):
+    """ANSI sequence that turns the lines `old` on the screen into `new`. The cursor
+    is expected at the beginning of the line below `old` and is left at the beginning
+    of the line below `new`.
+    """
+    out = []
+    row = len(old)
+    num_rows_on_screen = len(old) + 1
+    for k, line in enumerate(new):
+        if k < len(old) and old[k] == line:
+            continue
+        out.append(_move(row, k, num_rows_on_screen))
+        out.append("\r" + line + "\x1b[K")
+        row = k
+        num_rows_on_screen = max(num_rows_on_screen, k + 1)
+
+    out.append(_move(row, len(new), num_rows_on_screen))
+    out.append("\r")
+    if len(new) < len(old):
+        # clear what's left of the old table
+        out.append("\x1b[J")
+    return "".join(out)
+
+
+class LiveTable:
+    """A table that is redrawn in place in the terminal.
+
+    Every call to `update()` only rewrites the lines that actually changed since the
+    previous frame. Column widths never shrink between frames, so the layout is only
+    recomputed when a column grows.
+    """
+
+    def __init__(
+        self,
+        header=None,
+        alignment="l",
+        padding=(0, 1),
+        style=styles.thin_double,
+        file=None,
+    ):
+        self.header = header
+        self.alignment = _hashable(alignment)
+        self.padding = _hashable(padding)
+        self.style = style
+        self.file = sys.stdout if file is None else file
+        self.template = None
+        self.widths = StickyWidths()
+        self.lines = []
+
+    def update(self, data):
+        strings, cell_widths, numeric_columns, column_widths = _measure(
+            data, self.header, alignment=self.alignment
+        )
+        # a different number of columns starts over with the new widths
+        column_widths = self.widths.update(column_widths)
+        if self.template is None or tuple(column_widths) != self.template.column_widths:
+            self.template = Template(
+                column_widths, self.alignment, self.padding, self.style
+            )
+
+        lines = list(self.template._lines(strings, cell_widths, numeric_columns))
+        self.file.write(_diff(self.lines, lines))
+        self.file.flush()
+        self.lines = lines
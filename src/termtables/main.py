@@ -1,8 +1,10 @@
-import builtins
-import re
-from collections.abc import Sequence
+import functools
+import itertools
+import sys
+from collections.abc import Mapping, Sequence
 
-from . import styles
+from . import ansi, instrumentation, styles
+from ._width import string_width, truncate, wrap
 
 
 def _create_padding_tuple(padding):
@@ -22,63 +24,69 @@ def _create_padding_tuple(padding):
     return out
 
 
-def _create_alignment(alignment, num_columns):
+def _create_alignment(alignment, num_columns, values="lcrd"):
+    # "d" aligns numbers at their decimal point
     if len(alignment) == 1:
         alignment = num_columns * alignment
     assert len(alignment) == num_columns
+    assert all(align in values for align in alignment)
     return alignment
 
 
-def _remove_escape_sequences(string):
+@functools.lru_cache(maxsize=None)
+def _get_ansi_escape():
+    # Compiled on first use; importing re alone is a noticeable part of the startup.
+    import re
+
     # https://stackoverflow.com/a/14693789/353337
-    ansi_escape = re.compile(r"\x1B[@-_][0-?]*[ -/]*[@-~]")
-    return ansi_escape.sub("", string)
+    return re.compile(r"\x1B[@-_][0-?]*[ -/]*[@-~]")
 
 
-def _get_column_widths(strings, num_columns):
-    widths = num_columns * [0]
-    for block in strings:
-        for row in block:
-            for j, item in enumerate(row):
-                widths[j] = max(widths[j], len(_remove_escape_sequences(item)))
+def _remove_escape_sequences(string):
+    return _get_ansi_escape().sub("", string)
+
+
+def _display_width(string):
+    # Most cells don't contain any escape sequences, so skip the regex for those.
+    if "\x1b" in string:
+        string = _remove_escape_sequences(string)
+    if "\n" in string:
+        # multiline cells are as wide as their widest line
+        return max(string_width(line) for line in string.split("\n"))
+    return string_width(string)
+
+
+def _get_cell_widths(strings):
+    return [
+        [[_display_width(item) for item in row] for row in block] for block in strings
+    ]
+
+
+def _get_row_widths(row):
+    return [_display_width(item) for item in row]
+
+
+class _DoesNotFit(Exception):
+    pass
+
+
+def _check_row_widths(column_widths, row):
+    """The widths of the cells of a row, which must fit into `column_widths`"""
+    widths = [_display_width(item) for item in row]
+    for width, cw in zip(widths, column_widths):
+        if width > cw:
+            raise _DoesNotFit
     return widths
 
 
-def _align(strings, alignments, column_widths):
-    for block in strings:
-        for row in block:
-            for k, (item, align, cw) in enumerate(zip(row, alignments, column_widths)):
-                rest = cw - len(_remove_escape_sequences(item))
-                if rest == 0:
-                    # row[k] = item[:cw]
-                    row[k] = item
-                else:
-                    assert rest > 0
-                    if align == "l":
-                        left = 0
-                    elif align == "r":
-                        left = rest
-                    else:
-                        assert align == "c"
-                        left = rest // 2
-                    right = rest - left
-                    row[k] = " " * left + item + " " * right
-    return strings
-
-
-def _add_padding(strings, column_widths, padding):
-    for block in strings:
+def _get_column_widths(cell_widths, num_columns):
+    widths = num_columns * [0]
+    for block in cell_widths:
         for row in block:
-            for k, (item, cw) in enumerate(zip(row, column_widths)):
-                cw += padding[1] + padding[3]
-                s = []
-                for _ in range(padding[0]):
-                    s += [" " * cw]
-                s += [" " * padding[3] + item + " " * padding[1]]
-                for _ in range(padding[2]):
-                    s += [" " * cw]
-                row[k] = "\n".join(s)
-    return strings
+            for j, width in enumerate(row):
+                if width > widths[j]:
+                    widths[j] = width
+    return widths
 
 
 def _seq_but_not_str(obj):
@@ -86,34 +94,355 @@ def _seq_but_not_str(obj):
 
 
 def _get_depth(l):
-    if _seq_but_not_str(l):
-        return 1 + max(_get_depth(item) for item in l)
-    return 0
+    # Only follow the first element on every level. The row lengths are checked while
+    # converting the cells, and _check_depth() validates the entire input.
+    depth = 0
+    while _seq_but_not_str(l) and len(l) > 0:
+        l = l[0]
+        depth += 1
+    return depth
 
 
-def _hjoin_multiline(join_char, strings):
-    """Horizontal join of multiline strings"""
-    cstrings = [string.split("\n") for string in strings]
-    max_num_lines = max(len(item) for item in cstrings)
-    pp = []
-    for k in range(max_num_lines):
-        p = [cstring[k] for cstring in cstrings]
-        pp.append(join_char + join_char.join(p) + join_char)
+def _check_depth(l, depth):
+    if depth == 0:
+        assert not _seq_but_not_str(l)
+    else:
+        assert _seq_but_not_str(l)
+        for item in l:
+            _check_depth(item, depth - 1)
 
-    return "\n".join([p.rstrip() for p in pp])
 
+def _valign(lines, height, valign):
+    rest = height - len(lines)
+    if rest == 0:
+        return lines
+    if valign == "t":
+        top = 0
+    elif valign == "b":
+        top = rest
+    else:
+        assert valign == "m"
+        top = rest // 2
+    return top * [""] + lines + (rest - top) * [""]
 
-def print(*args, **kwargs):
-    builtins.print(to_string(*args, **kwargs))
 
+def _is_numeric_array(data):
+    # bool, signed and unsigned integers, floats
+    try:
+        return data.ndim == 2 and data.dtype.kind in "biuf" and data.size > 0
+    except AttributeError:
+        return False
 
-def to_string(
-    data, header=None, alignment="l", padding=(0, 1), style=styles.thin_double
+
+def _get_numeric_columns(data, formatters=None):
+    """Fast path for 2-D numeric NumPy arrays: Convert and measure entire columns at
+    once instead of going cell by cell.
+    """
+    import numpy
+
+    if formatters is None:
+        formatters = data.shape[1] * [str]
+    columns = [
+        _format_array(data[:, j], formatter) for j, formatter in enumerate(formatters)
+    ]
+    lengths = [numpy.char.str_len(col) for col in columns]
+    return columns, lengths
+
+
+def _is_plain(strings):
+    """Whether a NumPy string array only holds printable ASCII, whose width is the
+    number of characters, as the fast path takes for granted
+    """
+    import numpy
+
+    codes = strings.view(numpy.uint32)
+    # the unused characters are zeros
+    return bool(numpy.all(((codes >= 32) & (codes < 127)) | (codes == 0)))
+
+
+def _format_array(array, formatter):
+    import numpy
+
+    if formatter is str:
+        return array.astype(str)
+    return numpy.array([formatter(item) for item in array.tolist()], dtype=str)
+
+
+def _get_formatter(spec):
+    """The function that converts the cells of a column, resolved once per column.
+    `spec` is `None` (plain `str`), a format spec like ".3f" or ",", or a function.
+    """
+    if spec is None:
+        return str
+    if callable(spec):
+        return spec
+    fmt = ("{:" + spec + "}").format
+
+    def formatter(item):
+        try:
+            return fmt(item)
+        except (TypeError, ValueError):
+            # e.g., text in a column of numbers
+            return str(item)
+
+    return formatter
+
+
+def _get_formatters(formats, num_columns):
+    if formats is None:
+        return None
+    if isinstance(formats, str) or callable(formats):
+        formats = num_columns * [formats]
+    assert len(formats) == num_columns
+    return [_get_formatter(spec) for spec in formats]
+
+
+def _align_decimals(strings, widths):
+    """Pad the cells of a column so that their decimal points line up; cells without
+    a point are aligned like integers. Returns the strings, their widths, and the
+    column width.
+    """
+    fractions = [_display_width(s[s.index(".") :]) if "." in s else 0 for s in strings]
+    lefts = [w - f for w, f in zip(widths, fractions)]
+    left = max(lefts, default=0)
+    fraction = max(fractions, default=0)
+    strings = [
+        " " * (left - l) + s + " " * (fraction - f)
+        for s, l, f in zip(strings, lefts, fractions)
+    ]
+    return strings, len(strings) * [left + fraction], left + fraction
+
+
+def _align_decimals_numeric(strings, lengths):
+    """Same as `_align_decimals()` for the NumPy string arrays of numeric columns"""
+    import numpy
+
+    if strings.size == 0:
+        return strings, lengths, 0
+    points = numpy.char.find(strings, ".")
+    fractions = numpy.where(points >= 0, lengths - points, 0)
+    lefts = lengths - fractions
+    left = lefts.max()
+    width = int(left + fractions.max())
+    strings = numpy.char.add(numpy.char.multiply(" ", left - lefts), strings)
+    strings = numpy.char.ljust(strings, width)
+    return strings, numpy.full(len(strings), width), width
+
+
+def _align_decimal_rows(blocks, width_blocks, columns):
+    """Line up the decimal points in the given columns of row-oriented blocks."""
+    for j in columns:
+        strings, widths, _ = _align_decimals(
+            [row[j] for block in blocks for row in block],
+            [row[j] for block in width_blocks for row in block],
+        )
+        strings = iter(strings)
+        widths = iter(widths)
+        for block, block_widths in zip(blocks, width_blocks):
+            for row, row_widths in zip(block, block_widths):
+                row[j] = next(strings)
+                row_widths[j] = next(widths)
+
+
+def _get_columns(data):
+    """Column names and columns of column-oriented data, `None` for anything else.
+    Like rows, all columns must have the same length.
+    """
+    columns = _find_columns(data)
+    if columns is not None:
+        names, columns = columns
+        assert len(columns) > 0
+        num_rows = len(columns[0])
+        assert all(len(column) == num_rows for column in columns)
+        return names, columns
+    return None
+
+
+def _find_columns(data):
+    if isinstance(data, Mapping):
+        return list(data.keys()), list(data.values())
+    # NumPy structured and record arrays
+    names = getattr(getattr(data, "dtype", None), "names", None)
+    if names is not None:
+        return list(names), [data[name] for name in names]
+    # Arrow tables
+    if hasattr(data, "column_names") and hasattr(data, "column"):
+        names = list(data.column_names)
+        return names, [data.column(name) for name in names]
+    # pandas-like data frames
+    if hasattr(data, "columns") and hasattr(data, "shape"):
+        names = list(data.columns)
+        return names, [data[name] for name in names]
+    return None
+
+
+def _format_column(column, formatter=str):
+    """Convert and measure one column straight from its source. Returns the strings,
+    their widths, and the column width. Numeric arrays and series are handled in bulk
+    and returned as NumPy arrays, everything else as lists.
+    """
+    dtype = getattr(column, "dtype", None)
+    kind = getattr(dtype, "kind", None)
+    if kind is not None and kind in "biuf":
+        import numpy
+
+        # not for extension types, e.g., nullable integers in pandas
+        if isinstance(dtype, numpy.dtype):
+            strings = _format_array(numpy.asarray(column), formatter)
+            if formatter is str or _is_plain(strings):
+                lengths = numpy.char.str_len(strings)
+                return strings, lengths, int(lengths.max()) if lengths.size > 0 else 0
+            # wide characters or escape sequences, measured like any other strings
+            column = strings.tolist()
+            formatter = str
+
+    if hasattr(column, "to_pylist"):
+        # Arrow arrays
+        column = column.to_pylist()
+    strings = [formatter(item) for item in column]
+    widths = [_display_width(item) for item in strings]
+    return strings, widths, max(widths, default=0)
+
+
+def _measure_columns(names, columns, header, record=None, formats=None, alignment="l"):
+    if header is None:
+        header = names
+
+    formatters = _get_formatters(formats, len(columns)) or len(columns) * [str]
+    formatted = [_format_column(col, f) for col, f in zip(columns, formatters)]
+    strings = [[[str(item) for item in header]]] if header else []
+    if record is not None:
+        record.count_cells(strings[0][0] if strings else [])
+        for s, _, _ in formatted:
+            if isinstance(s, list):
+                record.count_cells(s)
+            else:
+                record.cells += len(s)
+        record.lap("stringify")
+
+    for j, align in enumerate(_create_alignment(alignment, len(columns))):
+        if align == "d":
+            s, w, _ = formatted[j]
+            if isinstance(s, list):
+                formatted[j] = _align_decimals(s, w)
+            else:
+                formatted[j] = _align_decimals_numeric(s, w)
+
+    cell_widths = _get_cell_widths(strings)
+    column_widths = _get_column_widths(cell_widths, len(columns))
+    column_widths = [max(a, b) for a, (_, _, b) in zip(column_widths, formatted)]
+    if record is not None:
+        record.lap("measure")
+
+    if all(not isinstance(s, list) and len(s) > 0 for s, _, _ in formatted):
+        numeric_columns = ([s for s, _, _ in formatted], [w for _, w, _ in formatted])
+        return strings, cell_widths, numeric_columns, column_widths
+
+    # Rows are only assembled while rendering, there is no transposed copy.
+    string_columns = [s if isinstance(s, list) else s.tolist() for s, _, _ in formatted]
+    width_columns = [w if isinstance(w, list) else w.tolist() for _, w, _ in formatted]
+    strings.append(zip(*string_columns))
+    cell_widths.append(zip(*width_columns))
+    return strings, cell_widths, None, column_widths
+
+
+# marks the rows left out between the head and the tail of a table
+_elision = "⋮"
+
+
+def _slice_column(column, start, stop):
+    # the values stay as they are for the formatters
+    if hasattr(column, "iloc"):
+        # pandas series, by position
+        return list(column.iloc[start:stop].to_numpy())
+    if hasattr(column, "to_pylist"):
+        return column[start:stop].to_pylist()
+    return list(column[start:stop])
+
+
+def _get_window(
+    data, header, head=None, tail=None, page=None, page_size=100, formats=None
 ):
+    """The rows of `data` that are actually shown and the header. Either `page`
+    (counting from 0) or the first `head` and the last `tail` rows are selected; an
+    elision row stands in for the rows in between. The rows are counted across the
+    blocks of 3-D data, which stay apart, with the elision row in a block of its own.
+    The selected rows are converted with `formats`, the elision row isn't. None of the
+    other rows are converted or measured.
+    """
+    columns = _get_columns(data)
+    if columns is None:
+        try:
+            depth = len(data.shape)
+        except AttributeError:
+            depth = _get_depth(data)
+        assert depth in [2, 3]
+        blocks = data if depth == 3 else [data]
+        sizes = [len(block) for block in blocks]
+        num_rows = sum(sizes)
+        non_empty = [block for block in blocks if len(block) > 0]
+        num_columns = len(non_empty[0][0]) if non_empty else 0
+
+        def get_rows(start, stop):
+            """The rows from `start` to `stop` in their blocks"""
+            out = []
+            offset = 0
+            for block, size in zip(blocks, sizes):
+                first = max(start - offset, 0)
+                last = min(stop - offset, size)
+                if first < last:
+                    out.append([list(row) for row in block[first:last]])
+                offset += size
+            return out
+
+    else:
+        depth = 2
+        names, columns = columns
+        if header is None:
+            header = names
+        num_rows = len(columns[0])
+        num_columns = len(columns)
+
+        def get_rows(start, stop):
+            cols = [_slice_column(c, start, stop) for c in columns]
+            return [[list(row) for row in zip(*cols)]]
+
+    formatters = _get_formatters(formats, num_columns) if num_rows > 0 else None
+    if formatters is not None:
+        get_raw_rows = get_rows
+
+        def get_rows(start, stop):
+            return [
+                [[f(item) for f, item in zip(formatters, row)] for row in block]
+                for block in get_raw_rows(start, stop)
+            ]
+
+    if page is not None:
+        start = page * page_size
+        assert 0 <= start < num_rows
+        window = get_rows(start, start + page_size)
+    else:
+        head = head or 0
+        tail = tail or 0
+        if head + tail >= num_rows:
+            window = get_rows(0, num_rows)
+        else:
+            window = get_rows(0, head)
+            window.append([num_columns * [_elision]])
+            window += get_rows(num_rows - tail, num_rows)
+
+    if depth == 2:
+        return [row for block in window for row in block], header
+    return window, header
+
+
+def _get_strings(data, header, strict=False, formats=None):
     try:
         depth = len(data.shape)
     except AttributeError:
         depth = _get_depth(data)
+        if strict:
+            _check_depth(data, depth)
 
     if depth == 2:
         data = [data]
@@ -123,79 +452,1112 @@ def to_string(
     if header:
         data = [[header]] + data
 
-    # Make sure the data is consistent
     num_columns = len(data[0][0])
-    for block in data:
+    formatters = _get_formatters(formats, num_columns)
+    strings = []
+    for k, block in enumerate(data):
+        # the header isn't formatted
+        block_formatters = None if header and k == 0 else formatters
+        block_strings = []
         for row in block:
+            # Make sure the data is consistent
             assert len(row) == num_columns
+            if block_formatters is None:
+                block_strings.append([str(item) for item in row])
+            else:
+                block_strings.append(
+                    [f(item) for f, item in zip(block_formatters, row)]
+                )
+        strings.append(block_strings)
+    return strings, num_columns
 
-    padding = _create_padding_tuple(padding)
-    alignments = _create_alignment(alignment, num_columns)
+
+def _get_verticals(style):
+    """The left border, the column separator, and the right border"""
     if style is None:
-        border_chars, block_sep_chars = None, None
-    else:
-        if len(style) == 11:
-            border_chars = style
-            block_sep_chars = [
-                border_chars[6],
-                border_chars[0],
-                border_chars[10],
-                border_chars[7],
+        return "", "", ""
+    return style.left, style.vertical, style.right
+
+
+def _border_row(left, fill, cross, right, column_widths_with_padding):
+    row = left + cross.join([s * fill for s in column_widths_with_padding]) + right
+    # blank rows are left out altogether
+    return row if row.strip() else None
+
+
+class Template:
+    """The layout of a table with fixed column widths. Alignment, padding, and all
+    border rows are computed once so that any number of tables of the same shape can
+    be rendered with it. Cells wider than their column overflow it, unless `overflow`
+    is "wrap" (word wrap) or "truncate" (cut off with an ellipsis).
+    """
+
+    def __init__(
+        self,
+        column_widths,
+        alignment="l",
+        padding=(0, 1),
+        style=styles.thin_double,
+        vertical_alignment="t",
+        keep_empty_rows=False,
+        overflow=None,
+    ):
+        assert overflow in [None, "wrap", "truncate"]
+        self.column_widths = tuple(column_widths)
+        self.num_columns = len(self.column_widths)
+        self.alignments = _create_alignment(alignment, self.num_columns)
+        self.vertical_alignments = _create_alignment(
+            vertical_alignment, self.num_columns, "tmb"
+        )
+        self.padding = _create_padding_tuple(padding)
+
+        # style strings and names are resolved once, see styles.get()
+        self.style = styles.get(style)
+        self.left, self.separator, self.right = _get_verticals(self.style)
+
+        cwp = [c + self.padding[1] + self.padding[3] for c in self.column_widths]
+        self.column_widths_with_padding = cwp
+
+        # Rows that would only consist of whitespace are not part of the output. For
+        # borders and padding rows, this is known in advance; content lines can only
+        # be empty if the vertical borders are whitespace.
+        self.first_border_row = None
+        self.intermediate_border_row = None
+        self.last_border_row = None
+        self.block_sep_row = None
+        if self.style is not None:
+            self.first_border_row = _border_row(*self.style.top_rule, cwp)
+            if self.style.inner_rule is not None:
+                self.intermediate_border_row = _border_row(*self.style.inner_rule, cwp)
+            self.last_border_row = _border_row(*self.style.bottom_rule, cwp)
+            self.block_sep_row = _border_row(*self.style.header_rule, cwp)
+
+        padding_row = _border_row(self.left, " ", self.separator, self.right, cwp)
+        if padding_row is None:
+            self.top_padding_rows = []
+            self.bottom_padding_rows = []
+        else:
+            padding_row = padding_row.rstrip()
+            self.top_padding_rows = self.padding[0] * [padding_row]
+            self.bottom_padding_rows = self.padding[2] * [padding_row]
+
+        verticals = self.left + self.separator + self.right
+        self.skip_empty_lines = not keep_empty_rows and not verticals.strip()
+
+        # The horizontal padding is part of what's put between the cells, so lines
+        # are joined in one go from the aligned cells.
+        self.line_start = self.left + " " * self.padding[3]
+        self.line_sep = " " * self.padding[1] + self.separator + " " * self.padding[3]
+        self.line_end = " " * self.padding[1] + self.right
+        # trailing whitespace is removed, unless the right border rules it out
+        self.strip_lines = not self.line_end or self.line_end[-1].isspace()
+        self.overflow = overflow
+
+    def to_string(self, data, header=None, formats=None):
+        strings, cell_widths, numeric_columns, _ = _measure(
+            data, header, formats=formats, alignment=self.alignments
+        )
+        return "\n".join(self._lines(strings, cell_widths, numeric_columns))
+
+    def _lines(self, strings, cell_widths, numeric_columns=None, paint=None, first=0):
+        return self._join(
+            self._blocks(strings, cell_widths, numeric_columns, paint, first)
+        )
+
+    def _blocks(self, strings, cell_widths, numeric_columns=None, paint=None, first=0):
+        """The rendered blocks. `paint` gives the escape codes of the cells of the rows
+        in the blocks from `first` on, see `ansi._get_painter()`.
+        """
+        if paint is None:
+            blocks = [
+                map(self._render_row, block, block_widths)
+                for block, block_widths in zip(strings, cell_widths)
             ]
         else:
-            assert len(style) == 15
-            border_chars = style[:11]
-            block_sep_chars = style[11:]
+            # the rows are counted across the blocks, which are rendered in order
+            counter = itertools.count()
+            blocks = [
+                (
+                    map(self._render_row, block, block_widths)
+                    if k < first
+                    else (
+                        self._render_row(row, row_widths, paint(next(counter), row))
+                        for row, row_widths in zip(block, block_widths)
+                    )
+                )
+                for k, (block, block_widths) in enumerate(zip(strings, cell_widths))
+            ]
+        if numeric_columns is not None:
+            blocks.append(self._render_numeric_columns(*numeric_columns))
+        return blocks
+
+    def _split_row(self, row, row_widths):
+        """Split a row into its lines, each of them a list of cells, and their widths.
+        Rows without multiline cells, by far the most common, stay as they are.
+        """
+        if not any("\n" in item for item in row):
+            return [row], [row_widths]
+
+        cells = [item.split("\n") for item in row]
+        height = max(len(lines) for lines in cells)
+        cells = [
+            _valign(lines, height, valign)
+            for lines, valign in zip(cells, self.vertical_alignments)
+        ]
+        row_lines = [list(line) for line in zip(*cells)]
+        line_widths = [[_display_width(item) for item in line] for line in row_lines]
+        return row_lines, line_widths
+
+    def _fit_row(self, row, row_widths):
+        """Wrap or truncate the cells that are wider than their column. Escape
+        sequences are removed from those cells.
+        """
+        if all(w <= cw for w, cw in zip(row_widths, self.column_widths)):
+            return row, row_widths
+
+        row = list(row)
+        row_widths = list(row_widths)
+        for j, (width, cw) in enumerate(zip(row_widths, self.column_widths)):
+            if width <= cw:
+                continue
+            item = _remove_escape_sequences(row[j])
+            if self.overflow == "wrap":
+                lines = wrap(item, cw)
+            else:
+                lines = [truncate(line, cw) for line in item.split("\n")]
+            row[j] = "\n".join(lines)
+            row_widths[j] = max(string_width(line) for line in lines)
+        return row, row_widths
+
+    def _render_line(self, cells, widths, codes=None):
+        """Render one line of cells into a string. Every cell is brought to the width
+        of its column with a single allocation at most, two for centered cells; cells
+        that fill their column are used as they are. `codes` are escape sequences that
+        the aligned cells are wrapped in.
+        """
+        aligned = []
+        for item, width, align, cw in zip(
+            cells, widths, self.alignments, self.column_widths
+        ):
+            rest = cw - width
+            if rest > 0:
+                # by length rather than width, for wide characters and escape codes
+                length = len(item)
+                if align == "l":
+                    item = item.ljust(length + rest)
+                elif align == "c":
+                    item = item.rjust(length + rest // 2).ljust(length + rest)
+                else:
+                    # "r", and "d" with the decimal points lined up already
+                    item = item.rjust(length + rest)
+            aligned.append(item)
+        if codes is not None:
+            aligned = [
+                code + item + ansi._reset if code else item
+                for item, code in zip(aligned, codes)
+            ]
+        line = self.line_start + self.line_sep.join(aligned) + self.line_end
+        return line.rstrip() if self.strip_lines else line
+
+    def _render_row(self, row, row_widths, codes=None):
+        """Render one row of strings into the list of its lines."""
+        if self.overflow is not None:
+            row, row_widths = self._fit_row(row, row_widths)
+        lines = [
+            self._render_line(line, widths, codes)
+            for line, widths in zip(*self._split_row(row, row_widths))
+        ]
+        if self.skip_empty_lines:
+            lines = [line for line in lines if line]
+        return self.top_padding_rows + lines + self.bottom_padding_rows
+
+    def _render_numeric_columns(self, columns, lengths, chunk_size=10000):
+        """Render the rows of numeric columns chunk by chunk."""
+        import numpy
+
+        top = self.top_padding_rows
+        bottom = self.bottom_padding_rows
+
+        sep = self.line_sep
+
+        for start in range(0, len(columns[0]), chunk_size):
+            aligned = []
+            for col, length, align, cw in zip(
+                columns, lengths, self.alignments, self.column_widths
+            ):
+                col = col[start : start + chunk_size]
+                if align == "l":
+                    col = numpy.char.ljust(col, cw)
+                elif align in "rd":
+                    col = numpy.char.rjust(col, cw)
+                else:
+                    assert align == "c"
+                    length = length[start : start + chunk_size]
+                    left = numpy.char.multiply(" ", (cw - length) // 2)
+                    col = numpy.char.ljust(numpy.char.add(left, col), cw)
+                aligned.append(col)
+
+            lines = numpy.char.add(self.line_start, aligned[0])
+            for col in aligned[1:]:
+                lines = numpy.char.add(numpy.char.add(lines, sep), col)
+            lines = numpy.char.add(lines, self.line_end)
+            lines = numpy.char.rstrip(lines).tolist()
+
+            if top or bottom:
+                for line in lines:
+                    yield top + [line] + bottom
+            else:
+                for line in lines:
+                    yield [line]
 
-    strings = [[[str(item) for item in row] for row in block] for block in data]
+    def _join(self, blocks):
+        """Generator over all lines of the table. `blocks` holds the rendered rows,
+        each of them a list of lines.
+        """
+        if self.first_border_row is not None:
+            yield self.first_border_row
+        for i, block in enumerate(blocks):
+            if i > 0 and self.block_sep_row is not None:
+                yield self.block_sep_row
+            for k, row in enumerate(block):
+                if k > 0 and self.intermediate_border_row is not None:
+                    yield self.intermediate_border_row
+                yield from row
+        if self.last_border_row is not None:
+            yield self.last_border_row
 
-    column_widths = _get_column_widths(strings, num_columns)
-    column_widths_with_padding = [c + padding[1] + padding[3] for c in column_widths]
 
-    # add spaces according to alignment
-    strings = _align(strings, alignments, column_widths)
+def _hashable(obj):
+    return tuple(obj) if _seq_but_not_str(obj) else obj
 
-    # add spaces according to padding
-    strings = _add_padding(strings, column_widths, padding)
 
-    # Join `strings` from the innermost to the outermost index.
-    join_char = border_chars[1] if border_chars else ""
-    for block in strings:
-        for k, row in enumerate(block):
-            block[k] = _hjoin_multiline(join_char, row)
+@functools.lru_cache(maxsize=128)
+def _get_template(
+    column_widths,
+    alignment,
+    padding,
+    style,
+    vertical_alignment,
+    keep_empty_rows,
+    overflow,
+):
+    return Template(
+        column_widths,
+        alignment,
+        padding,
+        style,
+        vertical_alignment,
+        keep_empty_rows,
+        overflow,
+    )
+
+
+def print(*args, **kwargs):
+    write(*args, **kwargs)
+
+
+class StickyWidths:
+    """Column widths that are remembered across renders and only ever grow, e.g., for
+    a status table that is shown again and again. Pass the same instance as
+    `column_widths` to every call.
+
+    Once the widths are known, the cells of row-oriented data are measured while the
+    rows are rendered, without a pass of its own. Only if a cell doesn't fit, the
+    table is measured and rendered again with the wider columns.
+    """
+
+    def __init__(self, widths=None):
+        self.widths = None if widths is None else list(widths)
+
+    def __repr__(self):
+        return f"StickyWidths({self.widths!r})"
+
+    def update(self, widths):
+        """Widen the columns to at least `widths`. A different number of columns
+        starts over.
+        """
+        if self.widths is None or len(self.widths) != len(widths):
+            self.widths = list(widths)
+        else:
+            self.widths = [max(a, b) for a, b in zip(self.widths, widths)]
+        return self.widths
+
+
+def _use_column_widths(measured, column_widths):
+    """Replace the measured column widths by `column_widths`, a list or
+    `StickyWidths`, if given.
+    """
+    if column_widths is None:
+        return measured
+    strings, cell_widths, numeric_columns, widths = measured
+    if isinstance(column_widths, StickyWidths):
+        return strings, cell_widths, numeric_columns, list(column_widths.update(widths))
+
+    assert len(column_widths) == len(widths)
+    if numeric_columns is not None and any(
+        w > cw for w, cw in zip(widths, column_widths)
+    ):
+        # only the generic code path can wrap or truncate
+        _numeric_columns_to_rows(strings, cell_widths, numeric_columns)
+        numeric_columns = None
+    return strings, cell_widths, numeric_columns, list(column_widths)
+
 
-    if border_chars:
-        bc = border_chars
-        cwp = column_widths_with_padding
-        intermediate_border_row = (
-            "\n" + bc[6] + bc[10].join([s * bc[0] for s in cwp]) + bc[7] + "\n"
+def _measure(
+    data,
+    header,
+    strict=False,
+    record=None,
+    formats=None,
+    alignment="l",
+    column_widths=None,
+):
+    """The strings, cell widths, numeric columns, and column widths of a table. Given
+    `column_widths` (a list or `StickyWidths`) are used instead of the widths of the
+    cells; see `_measure_rows()`.
+    """
+    columns = _get_columns(data)
+    if columns is not None:
+        measured = _measure_columns(*columns, header, record, formats, alignment)
+    else:
+        measured = _measure_rows(
+            data, header, strict, record, formats, alignment, column_widths
         )
+    return _use_column_widths(measured, column_widths)
+
+
+def _measure_rows(
+    data,
+    header,
+    strict=False,
+    record=None,
+    formats=None,
+    alignment="l",
+    column_widths=None,
+):
+    """With known `column_widths`, the cells of row-oriented data are measured while
+    rendering. The rows of `StickyWidths` are checked to fit, see `_render()`.
+    """
+    if _is_numeric_array(data):
+        num_columns = data.shape[1]
+        formatters = _get_formatters(formats, num_columns)
+        numeric_columns = _get_numeric_columns(data, formatters)
+        strings = [[[str(item) for item in header]]] if header else []
+        if formatters is not None and not all(
+            _is_plain(col) for col in numeric_columns[0]
+        ):
+            # wide characters or escape sequences from the formatters
+            columns = [col.tolist() for col in numeric_columns[0]]
+            strings.append([list(row) for row in zip(*columns)])
+            numeric_columns = None
     else:
-        intermediate_border_row = "\n"
+        numeric_columns = None
+        strings, num_columns = _get_strings(data, header, strict, formats)
+
+    if record is not None:
+        record.count_cells(item for block in strings for row in block for item in row)
+        if numeric_columns is not None:
+            record.cells += data.size
+        record.lap("stringify")
+
+    known_widths = column_widths
+    if isinstance(column_widths, StickyWidths):
+        known_widths = column_widths.widths
+    if (
+        known_widths is not None
+        and len(known_widths) == num_columns
+        and numeric_columns is None
+        and "d" not in alignment
+    ):
+        if known_widths is column_widths:
+            measure = _get_row_widths
+        else:
+            measure = functools.partial(_check_row_widths, known_widths)
+        cell_widths = [map(measure, block) for block in strings]
+        return strings, cell_widths, None, list(known_widths)
+
+    # measure every cell exactly once
+    cell_widths = _get_cell_widths(strings)
+
+    alignments = _create_alignment(alignment, num_columns)
+    decimal_columns = [j for j, align in enumerate(alignments) if align == "d"]
+    if numeric_columns is not None:
+        columns, lengths = numeric_columns
+        for j in decimal_columns:
+            columns[j], lengths[j], _ = _align_decimals_numeric(columns[j], lengths[j])
+    elif decimal_columns:
+        first = 1 if header else 0
+        _align_decimal_rows(strings[first:], cell_widths[first:], decimal_columns)
+
+    column_widths = _get_column_widths(cell_widths, num_columns)
+    if numeric_columns is not None:
+        column_widths = [
+            max(cw, int(length.max()))
+            for cw, length in zip(column_widths, numeric_columns[1])
+        ]
+    if record is not None:
+        record.lap("measure")
+    return strings, cell_widths, numeric_columns, column_widths
+
+
+class Cells:
+    """Formatted and measured cells, the intermediate that all output formats are
+    rendered from. Created by `prepare()`, it can be rendered any number of times
+    without converting the data again.
+    """
+
+    def __init__(
+        self,
+        strings,
+        cell_widths,
+        numeric_columns,
+        column_widths,
+        has_header,
+        alignments,
+    ):
+        # the rows of column-oriented data are iterators, which only work once
+        self.strings = [list(block) for block in strings]
+        self.cell_widths = [list(block) for block in cell_widths]
+        self.numeric_columns = numeric_columns
+        self.column_widths = list(column_widths)
+        self.has_header = has_header
+        self.alignments = alignments
 
-    for k, block in enumerate(strings):
-        strings[k] = intermediate_border_row.join(block)
+    @property
+    def header(self):
+        return self.strings[0][0] if self.has_header else None
 
-    if block_sep_chars:
-        bs = block_sep_chars
-        block_sep_row = (
-            "\n" + bs[0] + bs[2].join([s * bs[1] for s in cwp]) + bs[3] + "\n"
+    @property
+    def header_widths(self):
+        return self.cell_widths[0][0] if self.has_header else None
+
+    def blocks(self):
+        """Generator over the blocks of rows below the header, each of them an
+        iterator over the pairs of the strings and the widths of a row
+        """
+        first = 1 if self.has_header else 0
+        for block, block_widths in zip(self.strings[first:], self.cell_widths[first:]):
+            yield zip(block, block_widths)
+        if self.numeric_columns is not None:
+            columns, lengths = self.numeric_columns
+            yield zip(
+                zip(*[col.tolist() for col in columns]),
+                zip(*[length.tolist() for length in lengths]),
+            )
+
+    def _measured(self):
+        """Same as `_measure()`, copies that may be modified"""
+        return (
+            list(self.strings),
+            list(self.cell_widths),
+            self.numeric_columns,
+            list(self.column_widths),
         )
-    else:
-        block_sep_row = "\n"
 
-    strings = block_sep_row.join(strings)
 
-    if border_chars:
-        bc = border_chars
-        first_border_row = bc[2] + bc[8].join([s * bc[0] for s in cwp]) + bc[3] + "\n"
-        last_border_row = "\n" + bc[4] + bc[9].join([s * bc[0] for s in cwp]) + bc[5]
+def prepare(data, header=None, alignment="l", formats=None, strict=False):
+    """Format and measure the cells of a table once, e.g., to render it with
+    several backends (see `render()`) or `to_string()`. The arguments are those of
+    `to_string()`.
+    """
+    columns = _get_columns(data)
+    if columns is not None and header is None:
+        header = columns[0]
+    measured = _measure(data, header, strict, formats=formats, alignment=alignment)
+    alignments = _create_alignment(alignment, len(measured[3]))
+    return Cells(*measured, bool(header), alignments)
+
+
+def _get_layout(
+    alignment, padding, style, vertical_alignment, keep_empty_rows, overflow
+):
+    """The arguments of `Template` besides the column widths, hashable. Style names
+    are resolved here, so that templates cached under a name that has been
+    registered again aren't reused.
+    """
+    return (
+        _hashable(alignment),
+        _hashable(padding),
+        styles.get(style),
+        _hashable(vertical_alignment),
+        keep_empty_rows,
+        overflow,
+    )
+
+
+# Columns aren't shrunk below this width to make room for others, unless requested.
+_default_min_width = 4
+
+
+def _per_column(value, num_columns):
+    if value is None or isinstance(value, int):
+        return num_columns * [value]
+    assert len(value) == num_columns
+    return list(value)
+
+
+def _allocate_widths(widths, available, min_widths):
+    """Shrink the widest columns first until the total width fits into `available`.
+    Columns never get narrower than `min_widths`, so the result may still be too wide.
+    """
+    if sum(widths) <= available:
+        return widths
+
+    def total(cap):
+        return sum(max(min(w, cap), m) for w, m in zip(widths, min_widths))
+
+    # bisect for the largest cap on the column widths that fits
+    lo, hi = 0, max(widths)
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if total(mid) <= available:
+            lo = mid
+        else:
+            hi = mid - 1
+    out = [max(min(w, lo), m) for w, m in zip(widths, min_widths)]
+
+    # hand out what's left to the columns that were cut, left to right
+    rest = available - sum(out)
+    for j, w in enumerate(widths):
+        if rest <= 0:
+            break
+        if out[j] < w:
+            out[j] += 1
+            rest -= 1
+    return out
+
+
+def _constrain_widths(
+    column_widths, layout, max_width=None, min_widths=None, max_widths=None
+):
+    """Fit the measured column widths into the limits. `max_width` is the width of
+    the entire table, including borders and padding.
+    """
+    num_columns = len(column_widths)
+    min_widths = _per_column(min_widths, num_columns)
+    max_widths = _per_column(max_widths, num_columns)
+
+    widths = [w if m is None else min(w, m) for w, m in zip(column_widths, max_widths)]
+    widths = [w if m is None else max(w, m) for w, m in zip(widths, min_widths)]
+
+    if max_width is not None:
+        padding = _create_padding_tuple(layout[1])
+        left, separator, right = _get_verticals(styles.get(layout[2]))
+        overhead = (
+            num_columns * (padding[1] + padding[3])
+            + string_width(left)
+            + (num_columns - 1) * string_width(separator)
+            + string_width(right)
+        )
+        min_widths = [
+            min(w, _default_min_width) if m is None else m
+            for w, m in zip(widths, min_widths)
+        ]
+        widths = _allocate_widths(widths, max_width - overhead, min_widths)
+    return widths
+
+
+def _numeric_columns_to_rows(strings, cell_widths, numeric_columns):
+    """Move the numeric columns to the generic code path, e.g., to wrap them."""
+    columns, lengths = numeric_columns
+    strings.append(zip(*[col.tolist() for col in columns]))
+    cell_widths.append(zip(*[length.tolist() for length in lengths]))
+
+
+def _apply_limits(strings, cell_widths, numeric_columns, column_widths, layout, limits):
+    """The column widths within `limits`. Numeric columns that end up narrower than
+    their contents are moved to the generic code path, which can wrap them.
+    """
+    widths = _constrain_widths(column_widths, layout, *limits)
+    if numeric_columns is not None and widths != column_widths:
+        _numeric_columns_to_rows(strings, cell_widths, numeric_columns)
+        numeric_columns = None
+    return numeric_columns, widths
+
+
+def _render(
+    data,
+    header,
+    layout,
+    strict=False,
+    workers=None,
+    record=None,
+    limits=None,
+    formats=None,
+    column_widths=None,
+    attributes=None,
+):
+    """Generator over the lines of the table. `limits` are the arguments of
+    `_constrain_widths()` besides the column widths and the layout. `column_widths`
+    are those given by the caller, see `_measure()`. `attributes` are the column, row,
+    and cell attributes.
+    """
+    if attributes is not None and all(attrs is None for attrs in attributes):
+        attributes = None
+    first = 0 if attributes is None else int(_has_header(data, header))
+    if isinstance(data, Cells):
+        measured = _use_column_widths(data._measured(), column_widths)
     else:
-        first_border_row = ""
-        last_border_row = ""
-    out = first_border_row + strings + last_border_row
+        # decimal points are lined up across the entire column, not in chunks
+        if (
+            workers is not None
+            and workers > 1
+            and "d" not in layout[0]
+            and column_widths is None
+            and attributes is None
+        ):
+            from . import parallel
+
+            if parallel.is_parallelizable(data) and parallel.can_send(formats):
+                return parallel.lines(
+                    data, header, layout, strict, workers, record, limits, formats
+                )
+
+        measured = _measure(
+            data, header, strict, record, formats, layout[0], column_widths
+        )
+    lines = _layout(measured, layout, limits, attributes, first)
+    if isinstance(column_widths, StickyWidths):
+        try:
+            # nothing is returned before all cells are known to fit
+            lines = list(lines)
+        except _DoesNotFit:
+            measured = _measure(data, header, strict, None, formats, layout[0])
+            measured = _use_column_widths(measured, column_widths)
+            lines = _layout(measured, layout, limits, attributes, first)
+    if record is not None:
+        # the lines are generated lazily, so their time counts as "render"
+        lines = record.count_lines(lines)
+    return lines
+
+
+def _has_header(data, header):
+    if isinstance(data, Cells):
+        return data.has_header
+    if header is None:
+        # the column names of column-oriented data
+        columns = _get_columns(data)
+        return columns is not None and len(columns[0]) > 0
+    return bool(header)
+
+
+def _layout(measured, layout, limits=None, attributes=None, first=0):
+    """Generator over the lines of a measured table. The rows from block `first` on
+    get the `attributes`.
+    """
+    strings, cell_widths, numeric_columns, column_widths = measured
+    if limits is not None:
+        numeric_columns, column_widths = _apply_limits(
+            strings, cell_widths, numeric_columns, column_widths, layout, limits
+        )
+    paint = None
+    if attributes is not None:
+        paint = ansi._get_painter(*attributes, len(column_widths))
+        if numeric_columns is not None:
+            # the fast path has no attributes
+            _numeric_columns_to_rows(strings, cell_widths, numeric_columns)
+            numeric_columns = None
+    template = _get_template(tuple(column_widths), *layout)
+    return template._lines(strings, cell_widths, numeric_columns, paint, first)
+
+
+def _get_limits(max_width, min_widths, max_widths):
+    if max_width is None and min_widths is None and max_widths is None:
+        return None
+    return max_width, min_widths, max_widths
+
+
+def _get_terminal_width(file):
+    """The width of the terminal `file` is connected to, `None` for anything else."""
+    try:
+        if not file.isatty():
+            return None
+    except (AttributeError, ValueError):
+        return None
+    import shutil
+
+    return shutil.get_terminal_size().columns
+
+
+def _get_lines(
+    data,
+    header=None,
+    alignment="l",
+    padding=(0, 1),
+    style=styles.thin_double,
+    vertical_alignment="t",
+    keep_empty_rows=False,
+    strict=False,
+    workers=None,
+    max_width=None,
+    min_widths=None,
+    max_widths=None,
+    overflow="wrap",
+    head=None,
+    tail=None,
+    page=None,
+    page_size=100,
+    formats=None,
+    column_widths=None,
+    column_attributes=None,
+    row_attributes=None,
+    cell_attributes=None,
+    record=None,
+):
+    """Generator over the lines of the table, see `to_string()` for the arguments.
+    Unless `data` are `Cells`, they are converted and measured right away.
+    """
+    if head is not None or tail is not None or page is not None:
+        data, header = _get_window(data, header, head, tail, page, page_size, formats)
+        # the rows of the window are formatted already
+        formats = None
+    if isinstance(data, Cells):
+        alignment = data.alignments
+    layout = _get_layout(
+        alignment, padding, style, vertical_alignment, keep_empty_rows, overflow
+    )
+    limits = _get_limits(max_width, min_widths, max_widths)
+    attributes = (column_attributes, row_attributes, cell_attributes)
+    return _render(
+        data,
+        header,
+        layout,
+        strict,
+        workers,
+        record,
+        limits,
+        formats,
+        column_widths,
+        attributes,
+    )
+
+
+def to_string(
+    data,
+    header=None,
+    alignment="l",
+    padding=(0, 1),
+    style=styles.thin_double,
+    vertical_alignment="t",
+    keep_empty_rows=False,
+    strict=False,
+    workers=None,
+    max_width=None,
+    min_widths=None,
+    max_widths=None,
+    overflow="wrap",
+    head=None,
+    tail=None,
+    page=None,
+    page_size=100,
+    formats=None,
+    column_widths=None,
+    column_attributes=None,
+    row_attributes=None,
+    cell_attributes=None,
+):
+    """Render the table into a string.
+
+    `data` is either row-oriented (a 2-D array or a list of rows, or a list of blocks
+    of rows) or column-oriented (a dictionary of columns, a NumPy structured array, a
+    pandas data frame, or an Arrow table). For column-oriented data, the column names
+    serve as the header unless `header` is given; pass `header=False` to omit it.
+
+    Cells are converted with `str()` unless `formats` are given, one for all columns
+    or a list: format specs like ".3f" or ",", functions that return strings, or
+    `None`. Cells that don't match the spec, e.g., text in a numeric column, fall back
+    to `str()`. An `alignment` of "d" lines up numbers at their decimal point.
+
+    Cells with several lines are aligned vertically within their row according to
+    `vertical_alignment`, one of "t" (top), "m" (middle), "b" (bottom) per column.
+
+    Lines that only consist of whitespace are left out; set `keep_empty_rows` to keep
+    rows whose content is blank when the style has no visible vertical borders.
+
+    The shape of row-oriented data is determined from its first row; with `strict`,
+    the nesting of the entire input is validated, too.
+
+    For very large 2-D tables, `workers` > 1 measures and renders the rows in that
+    many processes, each of which gets an equal share of them. Small tables are always rendered serially, and so are
+    tables with `formats` that can't be pickled, e.g., lambdas.
+
+    With `max_width`, the widest columns are narrowed until the table, including
+    borders and padding, fits into that many characters. `min_widths` and
+    `max_widths` limit the width of each column (an int for all columns or a list).
+    Cells that don't fit are word-wrapped or, with `overflow="truncate"`, cut off with
+    an ellipsis.
+
+    To show only part of a table, pass `head` and/or `tail` (the number of rows at the
+    beginning and the end, with an elision row in between) or `page`, the number of
+    the page of `page_size` rows, counting from 0. The rows of blocks are counted
+    across the blocks. Only the rows shown are converted and measured.
 
-    # remove empty lines
-    out = "\n".join([s for s in out.splitlines() if s.strip()])
+    Known `column_widths` (a list) skip the measurement of the columns; cells that
+    don't fit are handled like with `max_width`. With a `StickyWidths` object, the
+    column widths are remembered across calls and never shrink, so repeated renders
+    of a changing table keep their layout and only measure what's necessary.
 
+    Colors and text attributes (`ansi.Attributes`) are given as `column_attributes`,
+    one for all columns or a list; `row_attributes`, a list that the rows get in turn
+    (e.g., `[None, Attributes(bg=236)]` for zebra stripes) or a function of the index
+    of the row; and `cell_attributes`, a function of the indices of the row and the
+    column and the string of the cell. They are combined in that order and don't
+    apply to the header. Unlike escape sequences in the cells, they don't need to be
+    removed for measuring.
+
+    `data` can also be the `Cells` from `prepare()`, which already hold the header,
+    the formatted cells, and their alignment.
+    """
+    record = instrumentation.start("to_string")
+    lines = _get_lines(
+        data,
+        header,
+        alignment=alignment,
+        padding=padding,
+        style=style,
+        vertical_alignment=vertical_alignment,
+        keep_empty_rows=keep_empty_rows,
+        strict=strict,
+        workers=workers,
+        max_width=max_width,
+        min_widths=min_widths,
+        max_widths=max_widths,
+        overflow=overflow,
+        head=head,
+        tail=tail,
+        page=page,
+        page_size=page_size,
+        formats=formats,
+        column_widths=column_widths,
+        column_attributes=column_attributes,
+        row_attributes=row_attributes,
+        cell_attributes=cell_attributes,
+        record=record,
+    )
+    out = "\n".join(lines)
+
+    if record is not None:
+        record.lap("render")
+        instrumentation.finish(record)
     return out
+
+
+def _write_lines(lines, file=None, encoding=None, num_buffered_lines=1000):
+    if file is None:
+        file = sys.stdout
+
+    def flush(buffer):
+        chunk = "\n".join(buffer) + "\n"
+        file.write(chunk if encoding is None else chunk.encode(encoding))
+
+    buffer = []
+    for line in lines:
+        buffer.append(line)
+        if len(buffer) >= num_buffered_lines:
+            flush(buffer)
+            buffer = []
+    if buffer:
+        flush(buffer)
+
+
+def write(
+    data,
+    header=None,
+    alignment="l",
+    padding=(0, 1),
+    style=styles.thin_double,
+    vertical_alignment="t",
+    keep_empty_rows=False,
+    strict=False,
+    workers=None,
+    max_width="terminal",
+    min_widths=None,
+    max_widths=None,
+    overflow="wrap",
+    head=None,
+    tail=None,
+    page=None,
+    page_size=100,
+    formats=None,
+    column_widths=None,
+    column_attributes=None,
+    row_attributes=None,
+    cell_attributes=None,
+    file=None,
+    encoding=None,
+):
+    """Write the table to `file` (default: `sys.stdout`) while it is being rendered,
+    so the full output string is never held in memory. If `encoding` is given, the
+    lines are encoded and `file` is expected to be a binary stream.
+
+    By default, tables written to a terminal are fit into its width; pass
+    `max_width=None` to never narrow any columns. See `to_string()` for the other
+    arguments.
+    """
+    record = instrumentation.start("write")
+    if max_width == "terminal":
+        max_width = _get_terminal_width(sys.stdout if file is None else file)
+    lines = _get_lines(
+        data,
+        header,
+        alignment=alignment,
+        padding=padding,
+        style=style,
+        vertical_alignment=vertical_alignment,
+        keep_empty_rows=keep_empty_rows,
+        strict=strict,
+        workers=workers,
+        max_width=max_width,
+        min_widths=min_widths,
+        max_widths=max_widths,
+        overflow=overflow,
+        head=head,
+        tail=tail,
+        page=page,
+        page_size=page_size,
+        formats=formats,
+        column_widths=column_widths,
+        column_attributes=column_attributes,
+        row_attributes=row_attributes,
+        cell_attributes=cell_attributes,
+        record=record,
+    )
+    _write_lines(lines, file, encoding)
+
+    if record is not None:
+        # includes the time spent writing
+        record.lap("render")
+        instrumentation.finish(record)
+
+
+def pages(
+    data,
+    page_size=100,
+    header=None,
+    alignment="l",
+    padding=(0, 1),
+    style=styles.thin_double,
+    vertical_alignment="t",
+    keep_empty_rows=False,
+    strict=False,
+    max_width=None,
+    min_widths=None,
+    max_widths=None,
+    overflow="wrap",
+    formats=None,
+):
+    """Generator over the pages of a table, each of them a string with the header and
+    up to `page_size` rows. All pages share the same column widths, so they line up
+    when shown one after the other, e.g., in a pager. The pages run across the blocks
+    of 3-D data, which stay apart within the pages. See `to_string()` for the other
+    arguments.
+    """
+    columns = _get_columns(data)
+    if columns is not None and header is None:
+        header = columns[0]
+
+    strings, cell_widths, numeric_columns, column_widths = _measure(
+        data, header, strict, formats=formats, alignment=alignment
+    )
+    layout = _get_layout(
+        alignment, padding, style, vertical_alignment, keep_empty_rows, overflow
+    )
+    limits = _get_limits(max_width, min_widths, max_widths)
+    if limits is not None:
+        numeric_columns, column_widths = _apply_limits(
+            strings, cell_widths, numeric_columns, column_widths, layout, limits
+        )
+    template = _get_template(tuple(column_widths), *layout)
+
+    # the header is repeated on every page
+    header_strings = [strings.pop(0)] if header else []
+    header_widths = [cell_widths.pop(0)] if header else []
+
+    if numeric_columns is not None:
+        columns, lengths = numeric_columns
+        for start in range(0, len(columns[0]), page_size):
+            page = (
+                [col[start : start + page_size] for col in columns],
+                [length[start : start + page_size] for length in lengths],
+            )
+            yield "\n".join(template._lines(header_strings, header_widths, page))
+        return
+
+    rows = (
+        (k, row, row_widths)
+        for k, (block, block_widths) in enumerate(zip(strings, cell_widths))
+        for row, row_widths in zip(block, block_widths)
+    )
+    while True:
+        page = list(itertools.islice(rows, page_size))
+        if not page:
+            break
+        blocks = []
+        widths = []
+        for _, group in itertools.groupby(page, key=lambda item: item[0]):
+            group = list(group)
+            blocks.append([row for _, row, _ in group])
+            widths.append([row_widths for _, _, row_widths in group])
+        yield "\n".join(
+            template._lines(header_strings + blocks, header_widths + widths)
+        )
+
+
+def stream(
+    rows,
+    header=None,
+    alignment="l",
+    padding=(0, 1),
+    style=styles.thin_double,
+    vertical_alignment="t",
+    keep_empty_rows=False,
+    column_widths=None,
+    num_sample_rows=100,
+    overflow=None,
+):
+    """Generator that yields the lines of a table as the rows arrive.
+
+    `rows` can be any iterable of rows, e.g., a generator reading from a file. The
+    column widths are either given explicitly via `column_widths` or taken from the
+    header and the first `num_sample_rows` rows; only those rows are held in memory.
+    Cells that turn out wider than their column overflow it, unless `overflow` is
+    "wrap" or "truncate".
+    """
+    rows = iter(rows)
+
+    if column_widths is None:
+        # without any rows to measure, there would be no widths
+        assert num_sample_rows >= 1, "num_sample_rows must be at least 1"
+        sample = [
+            [str(item) for item in row]
+            for row in itertools.islice(rows, num_sample_rows)
+        ]
+        strings = [sample]
+        if header is not None:
+            strings.append([[str(item) for item in header]])
+        if not strings[-1]:
+            return
+        num_columns = len(strings[-1][0])
+        column_widths = _get_column_widths(_get_cell_widths(strings), num_columns)
+    else:
+        sample = []
+
+    template = Template(
+        column_widths,
+        alignment,
+        padding,
+        style,
+        vertical_alignment,
+        keep_empty_rows,
+        overflow,
+    )
+
+    def render(row):
+        row = [str(item) for item in row]
+        assert len(row) == template.num_columns
+        return template._render_row(row, [_display_width(item) for item in row])
+
+    blocks = [map(render, itertools.chain(sample, rows))]
+    if header is not None:
+        blocks.insert(0, [render(header)])
+    yield from template._join(blocks)
@@ -0,0 +1,139 @@
+"""Rendering of very large 2-D tables in several processes.
+
+The rows are split into one range per process, and every process gets its rows
+only once. The processes format and measure their rows and send back the column
+widths, which are reduced to their maximum. Then, every process renders the strings
+it has kept with the common template. The lines are concatenated in order.
+"""
+
+import itertools
+
+from .main import (
+    _constrain_widths,
+    _get_cell_widths,
+    _get_column_widths,
+    _get_columns,
+    _get_depth,
+    _get_template,
+    _measure,
+    _numeric_columns_to_rows,
+)
+
+# Below this number of rows, the overhead of the processes doesn't pay off.
+threshold = 20000
+
+
+def is_parallelizable(data):
+    if _get_columns(data) is not None:
+        return False
+    try:
+        depth = len(data.shape)
+    except AttributeError:
+        depth = _get_depth(data)
+    return depth == 2 and len(data) >= threshold
+
+
+def can_send(formats):
+    """Whether the formats can be sent to the worker processes. Functions defined
+    within other functions and lambdas can't be pickled.
+    """
+    import pickle
+
+    try:
+        pickle.dumps(formats)
+    except (pickle.PicklingError, AttributeError, TypeError):
+        return False
+    return True
+
+
+def _work(conn, rows, strict, formats):
+    """Measure `rows` and send the column widths, then render them with the template
+    that is sent back and send the lines. An exception is sent instead of a result.
+    """
+    try:
+        strings, cell_widths, numeric_columns, column_widths = _measure(
+            rows, None, strict, formats=formats
+        )
+        conn.send((True, column_widths))
+        template = conn.recv()
+        if numeric_columns is not None and any(
+            w > cw for w, cw in zip(column_widths, template.column_widths)
+        ):
+            _numeric_columns_to_rows(strings, cell_widths, numeric_columns)
+            numeric_columns = None
+        blocks = template._blocks(strings, cell_widths, numeric_columns)
+        conn.send((True, [row for block in blocks for row in block]))
+    except Exception as e:
+        conn.send((False, e))
+    finally:
+        conn.close()
+
+
+def _receive(conn):
+    ok, value = conn.recv()
+    if not ok:
+        raise value
+    return value
+
+
+def lines(
+    data, header, layout, strict, workers, record=None, limits=None, formats=None
+):
+    import multiprocessing
+
+    size = -(-len(data) // workers)
+    processes = []
+    connections = []
+    try:
+        for start in range(0, len(data), size):
+            conn, child_conn = multiprocessing.Pipe()
+            process = multiprocessing.Process(
+                target=_work,
+                args=(child_conn, data[start : start + size], strict, formats),
+                daemon=True,
+            )
+            process.start()
+            child_conn.close()
+            processes.append(process)
+            connections.append(conn)
+
+        column_widths = [
+            max(widths) for widths in zip(*[_receive(conn) for conn in connections])
+        ]
+        blocks = []
+        if header:
+            header_strings = [[[str(item) for item in header]]]
+            header_widths = _get_cell_widths(header_strings)
+            column_widths = [
+                max(a, b)
+                for a, b in zip(
+                    column_widths, _get_column_widths(header_widths, len(column_widths))
+                )
+            ]
+        if limits is not None:
+            column_widths = _constrain_widths(column_widths, layout, *limits)
+        if record is not None:
+            record.cells = len(data) * len(column_widths)
+            record.lap("measure")
+
+        template = _get_template(tuple(column_widths), *layout)
+        for conn in connections:
+            conn.send(template)
+        if header:
+            blocks.append(template._blocks(header_strings, header_widths)[0])
+        blocks.append(
+            itertools.chain.from_iterable(_receive(conn) for conn in connections)
+        )
+
+        out = template._join(blocks)
+        if record is not None:
+            out = record.count_lines(out)
+        yield from out
+    finally:
+        # nothing is left to do for the processes unless rendering was cut short
+        for process in processes:
+            if process.is_alive():
+                process.terminate()
+            process.join()
+        for conn in connections:
+            conn.close()
@@ -1,19 +1,168 @@
-thin = "─│┌┐└┘├┤┬┴┼"
-thin_thick = "─│┌┐└┘├┤┬┴┼┝━┿┥"
-thin_double = "─│┌┐└┘├┤┬┴┼╞═╪╡"
-rounded = "─│╭╮╰╯├┤┬┴┼"
-rounded_thick = "─│╭╮╰╯├┤┬┴┼┝━┿┥"
-rounded_double = "─│╭╮╰╯├┤┬┴┼╞═╪╡"
-thick = "━┃┏┓┗┛┣┫┳┻╋"
-thick_thin = "─│┌┐└┘├┤┬┴┼┠─╂┨"
-double = "═║╔╗╚╝╠╣╦╩╬"
-double_thin = "═║╔╗╚╝╠╣╦╩╬╟─╫╢"
-booktabs = "─       ─── ━━ "
-
-ascii_thin = "-|+++++++++"
-ascii_thin_double = "-|++++++++++=++"
-ascii_double = "=H+++++++++"
-ascii_double_thin = "=H++++++++++-++"
-ascii_booktabs = "-       --- == "
-
-markdown = " |         |-||"
+import functools
+
+
+class Style:
+    """The characters that make up the borders of a table.
+
+    The positional arguments are in the order of the classic 11-character style
+    strings (see `from_string()`). The header rule, which also separates blocks,
+    defaults to the tees, `horizontal`, and `cross`; the outer vertical borders `left`
+    and `right` default to the column separator `vertical`. With
+    `inner_rules=False`, the rules between rows are left out.
+    """
+
+    _fields = (
+        "horizontal",
+        "vertical",
+        "top_left",
+        "top_right",
+        "bottom_left",
+        "bottom_right",
+        "left_tee",
+        "right_tee",
+        "top_tee",
+        "bottom_tee",
+        "cross",
+        "header_left",
+        "header_horizontal",
+        "header_cross",
+        "header_right",
+        "left",
+        "right",
+        "inner_rules",
+    )
+    # the fields plus the fragments of the rules, (left, fill, cross, right) each
+    __slots__ = _fields + ("top_rule", "inner_rule", "bottom_rule", "header_rule")
+
+    def __init__(
+        self,
+        horizontal,
+        vertical,
+        top_left,
+        top_right,
+        bottom_left,
+        bottom_right,
+        left_tee,
+        right_tee,
+        top_tee,
+        bottom_tee,
+        cross,
+        header_left=None,
+        header_horizontal=None,
+        header_cross=None,
+        header_right=None,
+        left=None,
+        right=None,
+        inner_rules=True,
+    ):
+        self.horizontal = horizontal
+        self.vertical = vertical
+        self.top_left = top_left
+        self.top_right = top_right
+        self.bottom_left = bottom_left
+        self.bottom_right = bottom_right
+        self.left_tee = left_tee
+        self.right_tee = right_tee
+        self.top_tee = top_tee
+        self.bottom_tee = bottom_tee
+        self.cross = cross
+        self.header_left = left_tee if header_left is None else header_left
+        self.header_horizontal = (
+            horizontal if header_horizontal is None else header_horizontal
+        )
+        self.header_cross = cross if header_cross is None else header_cross
+        self.header_right = right_tee if header_right is None else header_right
+        self.left = vertical if left is None else left
+        self.right = vertical if right is None else right
+        self.inner_rules = inner_rules
+
+        self.top_rule = (top_left, horizontal, top_tee, top_right)
+        self.bottom_rule = (bottom_left, horizontal, bottom_tee, bottom_right)
+        self.inner_rule = (
+            (left_tee, horizontal, cross, right_tee) if inner_rules else None
+        )
+        self.header_rule = (
+            self.header_left,
+            self.header_horizontal,
+            self.header_cross,
+            self.header_right,
+        )
+
+    @classmethod
+    def from_string(cls, string):
+        """The style from a string of 11 characters (horizontal, vertical, the corners
+        top left, top right, bottom left, bottom right, the tees left, right, top,
+        bottom, and the cross) or 15 characters, the last four of which make up the
+        header rule (left, horizontal, cross, right).
+        """
+        assert len(string) in [11, 15]
+        return cls(*string)
+
+    def replace(self, **changes):
+        """A copy of the style with some of the fields changed"""
+        kwargs = {name: getattr(self, name) for name in self._fields}
+        kwargs.update(changes)
+        return Style(**kwargs)
+
+    def _key(self):
+        return tuple(getattr(self, name) for name in self._fields)
+
+    def __eq__(self, other):
+        return isinstance(other, Style) and self._key() == other._key()
+
+    def __hash__(self):
+        return hash(self._key())
+
+    def __repr__(self):
+        args = ", ".join(f"{name}={getattr(self, name)!r}" for name in self._fields)
+        return f"Style({args})"
+
+
+thin = Style(*"─│┌┐└┘├┤┬┴┼")
+thin_thick = Style(*"─│┌┐└┘├┤┬┴┼┝━┿┥")
+thin_double = Style(*"─│┌┐└┘├┤┬┴┼╞═╪╡")
+rounded = Style(*"─│╭╮╰╯├┤┬┴┼")
+rounded_thick = Style(*"─│╭╮╰╯├┤┬┴┼┝━┿┥")
+rounded_double = Style(*"─│╭╮╰╯├┤┬┴┼╞═╪╡")
+thick = Style(*"━┃┏┓┗┛┣┫┳┻╋")
+thick_thin = Style(*"─│┌┐└┘├┤┬┴┼┠─╂┨")
+double = Style(*"═║╔╗╚╝╠╣╦╩╬")
+double_thin = Style(*"═║╔╗╚╝╠╣╦╩╬╟─╫╢")
+booktabs = Style(*"─       ─── ━━ ")
+
+ascii_thin = Style(*"-|+++++++++")
+ascii_thin_double = Style(*"-|++++++++++=++")
+ascii_double = Style(*"=H+++++++++")
+ascii_double_thin = Style(*"=H++++++++++-++")
+ascii_booktabs = Style(*"-       --- == ")
+
+markdown = Style(*" |         |-||")
+
+# only the header rule, no rules between the rows
+compact = thin.replace(inner_rules=False)
+ascii_compact = ascii_thin.replace(inner_rules=False)
+
+_registry = {
+    name: style for name, style in list(globals().items()) if isinstance(style, Style)
+}
+
+
+def register(name, style):
+    """Make `style` available by name, e.g., `to_string(data, style=name)`."""
+    _registry[name] = get(style)
+
+
+@functools.lru_cache(maxsize=None)
+def _from_string(string):
+    return Style.from_string(string)
+
+
+def get(style):
+    """The `Style` for a style, its registered name, or a classic style string.
+    `None` (no borders at all) stays `None`.
+    """
+    if style is None or isinstance(style, Style):
+        return style
+    if style in _registry:
+        return _registry[style]
+    return _from_string(style)
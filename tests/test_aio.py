@@ -0,0 +1,74 @@
+import asyncio
+import io
+
+import numpy as np
+import pytest
+
+import termtables as tt
+from termtables import aio
+
+
+def _run(coroutine):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+class _Writer:
+    def __init__(self):
+        self.buffer = io.BytesIO()
+        self.drains = 0
+
+    def write(self, data):
+        self.buffer.write(data)
+
+    async def drain(self):
+        self.drains += 1
+
+
+@pytest.mark.parametrize("num_rows", [10, aio.threshold + 10])
+def test_to_string_async(num_rows):
+    data = np.random.rand(num_rows, 3)
+    header = ["a", "b", "c"]
+    ref = tt.to_string(data, header, alignment="d", formats=".3f", max_width=30)
+    out = _run(
+        tt.to_string_async(data, header, alignment="d", formats=".3f", max_width=30)
+    )
+    assert out == ref
+
+    async def collect():
+        return [line async for line in tt.lines_async(data, header)]
+
+    assert "\n".join(_run(collect())) == tt.to_string(data, header)
+
+
+def test_write_async():
+    data = [[k, "x" * (k % 7)] for k in range(2 * aio.chunk_size)]
+    file = io.BytesIO()
+    tt.write(data, file=file, encoding="utf-8", style="ascii_thin")
+    writer = _Writer()
+    _run(tt.write_async(data, writer, style="ascii_thin"))
+    assert writer.buffer.getvalue() == file.getvalue()
+    assert writer.drains > 1
+
+
+def test_yields_control():
+    data = [[k, k**2] for k in range(aio.threshold - 1)]
+    ticks = []
+
+    async def tick():
+        while True:
+            ticks.append(None)
+            await asyncio.sleep(0)
+
+    async def main():
+        task = asyncio.ensure_future(tick())
+        out = await tt.to_string_async(data)
+        task.cancel()
+        return out
+
+    assert _run(main()) == tt.to_string(data)
+    # the other task ran between the chunks
+    assert len(ticks) > 1
@@ -0,0 +1,84 @@
+import numpy as np
+
+import termtables as tt
+
+data = [["a|b", 1.5], ["x_y & <z>", 22.25]]
+header = ["name", "value"]
+
+
+def test_markdown():
+    out = tt.render(data, "markdown", header=header, alignment="ld")
+    ref = "\n".join(
+        [
+            "| name      | value |",
+            "|:----------|------:|",
+            "| a\\|b      |  1.5  |",
+            "| x_y & <z> | 22.25 |",
+        ]
+    )
+    assert out == ref
+
+    # Markdown needs a header row
+    out = tt.render([["a\nb", "\x1b[31mred\x1b[0m"]], "markdown", alignment="cr")
+    assert out == "\n".join(
+        ["|        |     |", "|:------:|----:|", "| a<br>b | red |"]
+    )
+
+
+def test_html():
+    out = tt.render(data, "html", header=header, alignment="ld")
+    ref = "\n".join(
+        [
+            "<table>",
+            "<thead>",
+            '<tr><th>name</th><th style="text-align: right">value</th></tr>',
+            "</thead>",
+            "<tbody>",
+            '<tr><td>a|b</td><td style="text-align: right">1.5</td></tr>',
+            '<tr><td>x_y &amp; &lt;z&gt;</td><td style="text-align: right">22.25</td></tr>',
+            "</tbody>",
+            "</table>",
+        ]
+    )
+    assert out == ref
+
+
+def test_csv():
+    out = tt.render(data, "csv", header=header, alignment="ld")
+    assert out == "name,value\na|b,1.5\nx_y & <z>,22.25"
+    out = tt.render({"a": [1, 2], "b": ["x", "y, z"]}, "csv")
+    assert out == 'a,b\n1,x\n2,"y, z"'
+
+
+def test_latex():
+    out = tt.render(data, "latex", header=header, alignment="ld")
+    ref = "\n".join(
+        [
+            "\\begin{tabular}{lr}",
+            "\\hline",
+            " name        & value \\\\",
+            "\\hline",
+            " a|b         &  1.5  \\\\",
+            " x\\_y \\& <z> & 22.25 \\\\",
+            "\\hline",
+            "\\end{tabular}",
+        ]
+    )
+    assert out == ref
+
+
+def test_prepare():
+    array = np.array([[1.0, 2.5], [3.25, 4.0]])
+    cells = tt.prepare(array, header=["a", "b"], alignment="d", formats=".2f")
+    # the same cells, rendered several times and in several formats
+    ref = tt.to_string(array, header=["a", "b"], alignment="d", formats=".2f")
+    assert tt.to_string(cells) == ref
+    assert tt.render(cells) == ref
+    assert tt.to_string(cells, max_width=9) == tt.to_string(
+        array, header=["a", "b"], alignment="d", formats=".2f", max_width=9
+    )
+    assert tt.to_string(cells) == ref
+    assert tt.render(cells, "csv") == "a,b\n1.00,2.50\n3.25,4.00"
+    assert tt.render(cells, "terminal", style="ascii_thin") == tt.to_string(
+        cells, style="ascii_thin"
+    )
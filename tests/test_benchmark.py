@@ -0,0 +1,13 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "benchmarks"))
+
+import benchmark  # noqa: E402
+
+
+def test_benchmark(capsys):
+    benchmark.run(["--rows", "200", "--repeat", "1"])
+    out = capsys.readouterr().out
+    for name in ["plain", "wide", "multiline", "ansi", "padding", "blocks"]:
+        assert name in out
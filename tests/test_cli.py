@@ -0,0 +1,93 @@
+import io
+import subprocess
+import sys
+
+import pytest
+
+import termtables as tt
+from termtables import cli
+
+
+def _run(monkeypatch, capsys, stdin, *args):
+    monkeypatch.setattr(sys, "stdin", io.StringIO(stdin))
+    assert cli.main(list(args)) == 0
+    return capsys.readouterr().out
+
+
+def test_csv(monkeypatch, capsys):
+    stdin = "name,value\nalpha,1.5\nbeta,23\n"
+    out = _run(monkeypatch, capsys, stdin, "--alignment", "lr")
+    ref = tt.to_string(
+        [["alpha", "1.5"], ["beta", "23"]], header=["name", "value"], alignment="lr"
+    )
+    assert out == ref + "\n"
+
+    # no header, short rows
+    out = _run(monkeypatch, capsys, "1,2\n3\n", "-s", "ascii_thin", "-p", "0")
+    ref = tt.to_string([["1", "2"], ["3", ""]], style=tt.styles.ascii_thin, padding=0)
+    assert out == ref + "\n"
+
+
+def test_tsv_fixed_widths(monkeypatch, capsys):
+    stdin = "a\tb\nlong text\t2\n"
+    out = _run(
+        monkeypatch, capsys, stdin, "-f", "tsv", "-w", "4,1", "--overflow", "truncate"
+    )
+    assert out == tt.to_string([["lon…", "2"]], header=["a", "b"]) + "\n"
+
+
+def test_usage_errors(monkeypatch, capsys):
+    stdin = "a,b\n1,2\n"
+    for args in [
+        ["-a", "x"],
+        ["-a", "lrc"],
+        ["-w", "3"],
+        ["-w", "1,2,3"],
+        ["-n", "0", "--header", "no"],
+        ["-n", "x"],
+    ]:
+        monkeypatch.setattr(sys, "stdin", io.StringIO(stdin))
+        with pytest.raises(SystemExit) as info:
+            cli.main(args)
+        assert info.value.code == 2
+        assert "usage:" in capsys.readouterr().err
+
+
+def test_json_lines(monkeypatch, capsys):
+    stdin = '{"a": 1, "b": "x"}\n\n{"a": 22, "b": null}\n'
+    out = _run(monkeypatch, capsys, stdin, "-f", "jsonl", "-s", "markdown")
+    assert out == "| a  | b    |\n|----|------|\n| 1  | x    |\n| 22 | null |\n"
+
+    out = _run(monkeypatch, capsys, "[1, 2]\n[3, 4]\n", "-f", "jsonl", "-s", "none")
+    assert out == " 1  2\n 3  4\n"
+
+
+def test_json_lines_errors(monkeypatch, capsys):
+    for stdin, message in [
+        ('{"a": 1}\n{"a": 2, "b": 3}\n', "line 2 has the key 'b'"),
+        ('{"a": 1}\n[2]\n', "line 2 is not an object"),
+        ("[1]\n\n2\n", "line 3 is not an array"),
+        ('{"a": 1}\n{"a": \n', "line 2 is not valid JSON"),
+    ]:
+        monkeypatch.setattr(sys, "stdin", io.StringIO(stdin))
+        with pytest.raises(SystemExit) as info:
+            cli.main(["-f", "jsonl"])
+        assert message in str(info.value.code)
+
+
+def test_missing_file(tmp_path, capsys):
+    with pytest.raises(SystemExit) as info:
+        cli.main([str(tmp_path / "missing.csv")])
+    assert info.value.code == 2
+    assert "can't open" in capsys.readouterr().err
+
+
+def test_module(tmp_path):
+    path = tmp_path / "data.csv"
+    path.write_text("x,y\n1,2\n")
+    out = subprocess.run(
+        [sys.executable, "-m", "termtables", str(path), "--header", "yes"],
+        stdout=subprocess.PIPE,
+        check=True,
+    ).stdout.decode("utf-8")
+    assert out == tt.to_string([["1", "2"]], header=["x", "y"]) + "\n"
@@ -0,0 +1,56 @@
+import subprocess
+import sys
+
+import termtables as tt
+
+# Modules that are slow to import and only needed for some features
+deferred = [
+    "importlib.metadata",
+    "re",
+    "shutil",
+    "numpy",
+    "concurrent.futures",
+    "csv",
+    "html",
+    "asyncio",
+]
+
+
+def _run(code):
+    """The output of `code` in a fresh interpreter, and the modules loaded in the end"""
+    code = "\n".join([code, "import sys", "print(' '.join(sys.modules))"])
+    out = subprocess.run(
+        [sys.executable, "-c", code], stdout=subprocess.PIPE, check=True
+    ).stdout.decode()
+    lines = out.split("\n")
+    return lines[:-2], set(lines[-2].split())
+
+
+def test_import_time():
+    # the modules that the interpreter loads anyway, e.g., `re` in some versions
+    _, preloaded = _run("pass")
+    code = "\n".join(
+        [
+            "import time",
+            "t = time.perf_counter()",
+            "import termtables",
+            "print(time.perf_counter() - t)",
+        ]
+    )
+    durations = []
+    for _ in range(3):
+        out, modules = _run(code)
+        durations.append(float(out[0]))
+        for name in deferred:
+            assert name in preloaded or name not in modules
+    # generous, the import takes a few milliseconds
+    assert min(durations) < 0.1
+
+
+def test_version():
+    assert isinstance(tt.__version__, str)
+    assert "__version__" in vars(tt)
+
+    from termtables import __about__
+
+    assert __about__.__version__ == tt.__version__
@@ -0,0 +1,83 @@
+import io
+import re
+
+import termtables as tt
+
+
+def _apply(screen, row, output):
+    """Minimal terminal: apply the output of LiveTable to a list of lines."""
+    for token in re.findall(r"\x1b\[\d*[ABKJ]|\r|\n|[^\x1b\r\n]+", output):
+        if token == "\r":
+            col = 0
+        elif token == "\n":
+            row += 1
+            col = 0
+        elif token.endswith("A"):
+            row -= int(token[2:-1])
+        elif token.endswith("B"):
+            row += int(token[2:-1])
+        elif token.endswith("K"):
+            screen[row] = screen[row][:col]
+        elif token.endswith("J"):
+            del screen[row + 1 :]
+            screen[row] = ""
+        else:
+            while len(screen) <= row:
+                screen.append("")
+            screen[row] = screen[row][:col] + token
+            col += len(token)
+        while len(screen) <= row:
+            screen.append("")
+    return screen, row
+
+
+def test_live_table():
+    f = io.StringIO()
+    table = tt.LiveTable(header=["a", "b"], style=tt.styles.ascii_thin, file=f)
+    screen, row = [""], 0
+    widths = []
+
+    for data in [
+        [[1, 2], [3, 4]],
+        [[1, 2], [5, 4]],
+        [[1, 2], [5, 4], [6, 7]],
+        [[100, 2]],
+        [[1, 2]],
+    ]:
+        f.seek(0)
+        f.truncate()
+        table.update(data)
+        screen, row = _apply(screen, row, f.getvalue())
+        # column widths never shrink
+        template = tt.Template(table.template.column_widths, style=tt.styles.ascii_thin)
+        ref = template.to_string(data, header=["a", "b"])
+        assert screen[:row] == ref.split("\n")
+        assert screen[row:] == [""]
+        widths.append(table.template.column_widths)
+
+    assert widths == [(1, 1), (1, 1), (1, 1), (3, 1), (3, 1)]
+
+
+def test_live_table_redraws_changes_only():
+    f = io.StringIO()
+    table = tt.LiveTable(style=tt.styles.ascii_thin, file=f)
+    table.update([[1, 2], [3, 4]])
+
+    f.seek(0)
+    f.truncate()
+    table.update([[1, 2], [3, 5]])
+    assert f.getvalue() == "\x1b[2A\r| 3 | 5 |\x1b[K\x1b[2B\r"
+
+
+def test_live_table_number_of_columns():
+    f = io.StringIO()
+    table = tt.LiveTable(style=tt.styles.ascii_thin, file=f)
+    screen, row = [""], 0
+    for data in [[[100, 2]], [[1, 2, 3]], [[1, 2]]]:
+        f.seek(0)
+        f.truncate()
+        table.update(data)
+        screen, row = _apply(screen, row, f.getvalue())
+        ref = tt.to_string(data, style=tt.styles.ascii_thin)
+        assert screen[:row] == ref.split("\n")
+        assert screen[row:] == [""]
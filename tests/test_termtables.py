@@ -1,3 +1,6 @@
+import io
+import os
+import shutil
 import sys
 
 import numpy
@@ -458,3 +461,638 @@ def test_escape_sequences():
     assert string == "\n".join(
         ["┌─────┬─────┐", "│ key │ \033[31mred\033[0m │", "└─────┴─────┘"]
     )
+
+
+def test_stream():
+    header = ["a", "bb", "ccc"]
+    data = [[1, 2, 3], [613.23236243236, 613.23236243236, 613.23236243236]]
+
+    lines = tt.stream(iter(data), header=header, style=tt.styles.ascii_thin_double)
+    ref = tt.to_string(data, header=header, style=tt.styles.ascii_thin_double)
+    assert "\n".join(lines) == ref
+
+
+def test_stream_num_sample_rows():
+    data = [[1, 2], [3, 4]]
+    lines = tt.stream(iter(data), num_sample_rows=1)
+    assert "\n".join(lines) == tt.to_string(data)
+
+    with pytest.raises(AssertionError):
+        list(tt.stream(iter(data), num_sample_rows=0))
+
+
+def test_stream_column_widths():
+    data = ([k, 2 ** k] for k in range(3))
+
+    lines = tt.stream(data, style=tt.styles.ascii_thin, column_widths=[1, 3])
+
+    assert list(lines) == [
+        "+---+-----+",
+        "| 0 | 1   |",
+        "+---+-----+",
+        "| 1 | 2   |",
+        "+---+-----+",
+        "| 2 | 4   |",
+        "+---+-----+",
+    ]
+
+
+def test_numpy_fast_path():
+    numpy.random.seed(0)
+    data = numpy.random.rand(4, 3) * 10 ** numpy.arange(3)
+    header = ["a", "bbbbbbbbbbbbbbbbbbbbbbbbb", "c"]
+
+    for kwargs in [
+        {},
+        {"header": header, "alignment": "lcr"},
+        {"padding": (1, 2, 0, 3), "style": tt.styles.booktabs},
+        {"style": None, "padding": 0, "alignment": "c"},
+    ]:
+        ref = tt.to_string(data.tolist(), **kwargs)
+        assert tt.to_string(data, **kwargs) == ref
+
+    data = numpy.arange(6).reshape(3, 2)
+    assert tt.to_string(data) == tt.to_string(data.tolist())
+
+
+def test_escape_sequences_width():
+    data = [["\033[1m\033[31mred\033[0m", "x"], ["blue", "\033[32my\033[0m"]]
+
+    string = tt.to_string(data, style=tt.styles.ascii_thin, alignment="r")
+
+    assert string == "\n".join(
+        [
+            "+------+---+",
+            "|  \033[1m\033[31mred\033[0m | x |",
+            "+------+---+",
+            "| blue | \033[32my\033[0m |",
+            "+------+---+",
+        ]
+    )
+
+
+def test_wide_characters():
+    # CJK characters take up two columns, combining accents none
+    data = [["日本語", "e\u0301"], ["abc", "xyz"]]
+
+    string = tt.to_string(data, style=tt.styles.ascii_thin)
+
+    assert string == "\n".join(
+        [
+            "+--------+-----+",
+            "| 日本語 | e\u0301   |",
+            "+--------+-----+",
+            "| abc    | xyz |",
+            "+--------+-----+",
+        ]
+    )
+
+
+def test_template():
+    template = tt.Template([3, 5], alignment="rl", style=tt.styles.ascii_thin)
+
+    assert template.to_string([[1, "a"], [22, "bb"]], header=["x", "y"]) == "\n".join(
+        [
+            "+-----+-------+",
+            "|   x | y     |",
+            "+-----+-------+",
+            "|   1 | a     |",
+            "+-----+-------+",
+            "|  22 | bb    |",
+            "+-----+-------+",
+        ]
+    )
+    data = numpy.array([[1.5, 2.0]])
+    assert template.to_string(data) == "\n".join(
+        ["+-----+-------+", "| 1.5 | 2.0   |", "+-----+-------+"]
+    )
+
+
+def test_template_cache():
+    tt.main._get_template.cache_clear()
+    data = [[1, 2], [3, 4]]
+
+    ref = tt.to_string(data, padding=[0, 1])
+    assert tt.to_string([[5, 6], [7, 8]], padding=[0, 1]) != ref
+    assert tt.main._get_template.cache_info().hits == 1
+
+
+def test_write():
+    numpy.random.seed(0)
+    header = ["a", "bb", "ccc"]
+    data = [[1, 2, 3], [613.23236243236, 613.23236243236, 613.23236243236]]
+    ref = tt.to_string(data, header)
+
+    f = io.StringIO()
+    tt.write(data, header, file=f)
+    assert f.getvalue() == ref + "\n"
+
+    f = io.BytesIO()
+    tt.write(data, header, file=f, encoding="utf-8")
+    assert f.getvalue() == (ref + "\n").encode("utf-8")
+
+    data = numpy.random.rand(25000, 2)
+    f = io.StringIO()
+    tt.write(data, file=f)
+    assert f.getvalue() == tt.to_string(data) + "\n"
+
+
+def test_keep_empty_rows():
+    data = [["a", "b"], ["", ""], ["c", "d"]]
+
+    assert tt.to_string(data, style=None, padding=0) == "ab\ncd"
+    string = tt.to_string(data, style=None, padding=0, keep_empty_rows=True)
+    assert string == "ab\n\ncd"
+
+    # padding rows are never kept if they are blank
+    string = tt.to_string(data, style=None, padding=1, keep_empty_rows=True)
+    assert string == " a  b\n\n c  d"
+
+
+def test_columns():
+    data = {"id": [1, 2], "name": ["alpha", "beta"], "x": [0.5, 1.25]}
+
+    string = tt.to_string(data, style=tt.styles.ascii_thin_double)
+
+    assert string == "\n".join(
+        [
+            "+----+-------+------+",
+            "| id | name  | x    |",
+            "+====+=======+======+",
+            "| 1  | alpha | 0.5  |",
+            "+----+-------+------+",
+            "| 2  | beta  | 1.25 |",
+            "+----+-------+------+",
+        ]
+    )
+
+    ref = tt.to_string([[1, "alpha", 0.5], [2, "beta", 1.25]], header=["a", "b", "c"])
+    assert tt.to_string(data, header=["a", "b", "c"]) == ref
+    assert tt.to_string(data, header=False) == tt.to_string(
+        [[1, "alpha", 0.5], [2, "beta", 1.25]]
+    )
+
+
+def test_columns_validation():
+    # columns of different lengths, like rows of different lengths
+    for data in [{"a": [1, 2, 3], "b": ["x"]}, {"a": [1, 2, 3], "b": [1]}]:
+        with pytest.raises(AssertionError):
+            tt.to_string(data)
+        with pytest.raises(AssertionError):
+            tt.to_string(data, head=1)
+    # no columns at all
+    with pytest.raises(AssertionError):
+        tt.to_string({})
+    # no rows are fine
+    assert tt.to_string({"a": []}, style=None) == " a"
+
+
+def test_structured_array():
+    data = numpy.array([(1, 0.5), (2, 1.25)], dtype=[("id", int), ("x", float)])
+
+    string = tt.to_string(data, style=tt.styles.ascii_thin_double, alignment="r")
+
+    assert string == "\n".join(
+        [
+            "+----+------+",
+            "| id |    x |",
+            "+====+======+",
+            "|  1 |  0.5 |",
+            "+----+------+",
+            "|  2 | 1.25 |",
+            "+----+------+",
+        ]
+    )
+
+
+def test_validation():
+    # the shape is taken from the first row
+    data = [[1, 2], [3, [4, 5]]]
+    assert tt.to_string(data, style=None, padding=0) == "12\n3[4, 5]"
+    with pytest.raises(AssertionError):
+        tt.to_string(data, strict=True)
+
+    with pytest.raises(AssertionError):
+        tt.to_string([[1, 2], [3]])
+
+
+def test_profile():
+    data = [["key", "\033[31mred\033[0m"], ["a", "b"]]
+    records = []
+
+    with tt.profile(callback=records.append) as prof:
+        string = tt.to_string(data, header=["x", "y"])
+        tt.write(numpy.zeros((2, 3)), file=io.StringIO())
+
+    assert prof.records == records
+    rec = records[0]
+    assert rec.function == "to_string"
+    assert (rec.cells, rec.ansi_cells) == (6, 1)
+    assert rec.lines == len(string.split("\n"))
+    assert rec.bytes == len(string.encode("utf-8")) - (rec.lines - 1)
+    assert set(rec.durations) == {"stringify", "measure", "render"}
+
+    assert records[1].function == "write"
+    assert (records[1].cells, records[1].lines) == (6, 5)
+
+    # nothing is recorded outside of the context
+    tt.to_string(data)
+    assert len(prof.records) == 2
+
+
+def test_multiline_cells():
+    data = [["a\nbb\nc", "x", "1\n2"], ["d", "eee", "f"]]
+
+    string = tt.to_string(
+        data, style=tt.styles.ascii_thin, alignment="lrc", vertical_alignment="tmb"
+    )
+
+    assert string == "\n".join(
+        [
+            "+----+-----+---+",
+            "| a  |     |   |",
+            "| bb |   x | 1 |",
+            "| c  |     | 2 |",
+            "+----+-----+---+",
+            "| d  | eee | f |",
+            "+----+-----+---+",
+        ]
+    )
+
+
+def test_workers(monkeypatch):
+    from termtables import parallel
+
+    monkeypatch.setattr(parallel, "threshold", 10)
+    numpy.random.seed(0)
+    header = ["a", "bb", "ccc"]
+    data = [[k, "x" * (k % 7), 1 / (k + 1)] for k in range(3000)]
+
+    ref = tt.to_string(data, header=header, alignment="rcl")
+    assert tt.to_string(data, header=header, alignment="rcl", workers=2) == ref
+
+    data = numpy.random.rand(2500, 3)
+    assert tt.to_string(data, workers=2) == tt.to_string(data)
+
+    # formats that can't be pickled are applied serially
+    formats = [None, None, lambda x: f"{x:.0%}"]
+    ref = tt.to_string(data, formats=formats)
+    assert tt.to_string(data, formats=formats, workers=2) == ref
+    assert not parallel.can_send(formats)
+    assert parallel.can_send([None, ",", ".3f"])
+
+    # errors in the worker processes are raised in the caller
+    with pytest.raises(AssertionError):
+        tt.to_string(20 * [[1, 2]] + [[3, [4]]], strict=True, workers=2)
+
+    # below the threshold, or for 3-D data, everything stays serial
+    assert not parallel.is_parallelizable(data[:5])
+    assert not parallel.is_parallelizable([[[1, 2]] * 20])
+
+
+def test_max_width():
+    data = [["id 1", "the quick brown fox", 3.14159], ["id 2", "short", "x" * 20]]
+    header = ["id", "text", "value"]
+
+    string = tt.to_string(data, header, style=tt.styles.ascii_thin, max_width=30)
+    assert string == "\n".join(
+        [
+            "+------+----------+----------+",
+            "| id   | text     | value    |",
+            "+------+----------+----------+",
+            "| id 1 | the      | 3.14159  |",
+            "|      | quick    |          |",
+            "|      | brown    |          |",
+            "|      | fox      |          |",
+            "+------+----------+----------+",
+            "| id 2 | short    | xxxxxxxx |",
+            "|      |          | xxxxxxxx |",
+            "|      |          | xxxx     |",
+            "+------+----------+----------+",
+        ]
+    )
+
+    string = tt.to_string(
+        data, header, style=None, max_width=30, overflow="truncate", padding=0
+    )
+    assert string == "\n".join(
+        [
+            "id  text         value",
+            "id 1the quick br…3.14159",
+            "id 2short        xxxxxxxxxxxx…",
+        ]
+    )
+    assert max(len(line) for line in string.split("\n")) == 30
+
+    # numeric arrays are wrapped, too
+    data = numpy.arange(6).reshape(2, 3) * 10 ** 6
+    lines = tt.to_string(data, max_width=22).split("\n")
+    assert max(len(line) for line in lines) == 22
+    assert lines[1:3] == ["│ 0    │ 1000 │ 2000 │", "│      │ 000  │ 000  │"]
+
+
+def test_column_width_limits():
+    data = [["alpha beta", "gamma"]]
+
+    string = tt.to_string(data, style=None, max_widths=[5, None], min_widths=[1, 8])
+    assert string == "\n".join([" alpha  gamma", " beta"])
+
+    # wide characters and long words
+    assert tt.Template([4], style=None, overflow="wrap").to_string(
+        [["日本語のテキスト"], ["abcdefghi"]]
+    ) == "\n".join([" 日本", " 語の", " テキ", " スト", " abcd", " efgh", " i"])
+
+
+def test_write_max_width(monkeypatch):
+    data = [["a" * 100]]
+    file = io.StringIO()
+    tt.write(data, file=file)
+    assert file.getvalue() == tt.to_string(data) + "\n"
+
+    monkeypatch.setattr(
+        shutil, "get_terminal_size", lambda: os.terminal_size((40, 20))
+    )
+    file = io.StringIO()
+    file.isatty = lambda: True
+    tt.write(data, file=file)
+    assert file.getvalue() == tt.to_string(data, max_width=40) + "\n"
+
+
+def test_window():
+    data = [[k, k * k] for k in range(1000)]
+
+    string = tt.to_string(
+        data, header=["k", "k²"], style=tt.styles.ascii_thin, head=2, tail=1
+    )
+    assert string == "\n".join(
+        [
+            "+-----+--------+",
+            "| k   | k²     |",
+            "+-----+--------+",
+            "| 0   | 0      |",
+            "+-----+--------+",
+            "| 1   | 1      |",
+            "+-----+--------+",
+            "| ⋮   | ⋮      |",
+            "+-----+--------+",
+            "| 999 | 998001 |",
+            "+-----+--------+",
+        ]
+    )
+
+    assert tt.to_string(data, page=3, page_size=10) == tt.to_string(data[30:40])
+    # nothing left out
+    assert tt.to_string(data[:4], head=2, tail=2) == tt.to_string(data[:4])
+
+    array = numpy.arange(10.0).reshape(5, 2)
+    assert tt.to_string(array, tail=2) == tt.to_string([["⋮", "⋮"], *array[3:]])
+
+    columns = {"a": list(range(5)), "b": numpy.arange(5) * 1.5}
+    assert tt.to_string(columns, head=1, tail=1) == tt.to_string(
+        [[0, 0.0], ["⋮", "⋮"], [4, 6.0]], header=["a", "b"]
+    )
+
+    # the elision row isn't formatted
+    data = [[k, k / 4] for k in range(100)]
+    formats = [None, lambda x: f"{x:.1%}"]
+    assert tt.to_string(data, head=2, tail=1, formats=formats) == tt.to_string(
+        [[0, "0.0%"], [1, "25.0%"], ["⋮", "⋮"], [99, "2475.0%"]]
+    )
+    assert tt.to_string(data, page=1, page_size=2, formats=".2f") == tt.to_string(
+        [["2.00", "0.50"], ["3.00", "0.75"]]
+    )
+
+    # rows are counted across blocks, which stay apart
+    blocks = [[[1, 2], [3, 4]], [[5, 6], [7, 8], [9, 10]]]
+    assert tt.to_string(blocks, head=1, tail=2) == tt.to_string(
+        [[[1, 2]], [["⋮", "⋮"]], [[7, 8], [9, 10]]]
+    )
+    assert tt.to_string(blocks, head=3, tail=2) == tt.to_string(blocks)
+    assert tt.to_string(blocks, page=1, page_size=2) == tt.to_string([[[5, 6], [7, 8]]])
+    assert tt.to_string(blocks, page=0, page_size=3) == tt.to_string(
+        [[[1, 2], [3, 4]], [[5, 6]]]
+    )
+
+
+def test_pages():
+    data = [[k, "x" * k] for k in range(5)]
+
+    pages = list(tt.pages(data, page_size=2, header=["a", "b"]))
+    assert len(pages) == 3
+    full = tt.to_string(data, header=["a", "b"])
+    width = len(full.split("\n")[0])
+    for page in pages:
+        assert all(len(line) <= width for line in page.split("\n"))
+        assert page.split("\n")[:3] == full.split("\n")[:3]
+    assert pages[2].split("\n")[3] == full.split("\n")[-2]
+
+    array = numpy.arange(6).reshape(3, 2) * 1000
+    pages = list(tt.pages(array, page_size=2))
+    assert pages == [
+        tt.Template([4, 4]).to_string(array[:2]),
+        tt.Template([4, 4]).to_string(array[2:]),
+    ]
+
+    # pages run across blocks
+    blocks = [[[1, 2], [3, 4]], [[5, 6], [7, 8], [9, 10]]]
+    pages = list(tt.pages(blocks, page_size=3, header=["a", "b"]))
+    template = tt.Template([1, 2])
+    assert pages == [
+        template.to_string([[[1, 2], [3, 4]], [[5, 6]]], header=["a", "b"]),
+        template.to_string([[7, 8], [9, 10]], header=["a", "b"]),
+    ]
+
+
+def test_formats():
+    data = [[1, 3.14159, 1234567], [22, -0.5, "n/a"]]
+
+    string = tt.to_string(
+        data,
+        header=["i", "x", "n"],
+        formats=[None, ".3f", ","],
+        style=tt.styles.ascii_thin,
+        alignment="lrr",
+    )
+    assert string == "\n".join(
+        [
+            "+----+--------+-----------+",
+            "| i  |      x |         n |",
+            "+----+--------+-----------+",
+            "| 1  |  3.142 | 1,234,567 |",
+            "+----+--------+-----------+",
+            "| 22 | -0.500 |       n/a |",
+            "+----+--------+-----------+",
+        ]
+    )
+
+    # NumPy arrays and columns, format functions
+    array = numpy.array([[0.5, 2.0], [1.25, 3.0]])
+    assert tt.to_string(array, formats=".1f") == tt.to_string(
+        [["0.5", "2.0"], ["1.2", "3.0"]]
+    )
+    assert tt.to_string({"a": array[:, 0]}, formats=lambda x: f"{x:.0%}") == (
+        tt.to_string([["50%"], ["125%"]], header=["a"])
+    )
+
+
+def test_formats_wide_characters():
+    # formatted numbers are measured by their display width, like any other strings
+    array = numpy.array([[1, 2], [30, 4]])
+    for formats in [lambda x: f"{x}円", lambda x: f"\x1b[1m{x}\x1b[0m"]:
+        ref = tt.to_string(array.tolist(), formats=formats)
+        assert tt.to_string(array, formats=formats) == ref
+        columns = {"a": array[:, 0], "b": array[:, 1]}
+        assert tt.to_string(columns, header=False, formats=formats) == ref
+
+
+def test_decimal_alignment():
+    data = [[1.5, "a"], [-10.25, "b"], [300, "c"]]
+    ref = "\n".join(
+        [
+            "+--------+---+",
+            "|      x | y |",
+            "+--------+---+",
+            "|   1.5  | a |",
+            "+--------+---+",
+            "| -10.25 | b |",
+            "+--------+---+",
+            "| 300    | c |",
+            "+--------+---+",
+        ]
+    )
+    kwargs = {"style": tt.styles.ascii_thin, "alignment": "dl"}
+    assert tt.to_string(data, header=["x", "y"], **kwargs) == ref
+    assert tt.to_string({"x": [1.5, -10.25, 300], "y": "abc"}, **kwargs) == ref
+    assert (
+        tt.to_string({"x": numpy.array([1.5, -10.25, 300.0]), "y": "abc"}, **kwargs)
+        == ref.replace("300   ", "300.0 ")
+    )
+
+    with pytest.raises(AssertionError):
+        tt.to_string(data, alignment="x")
+
+
+def test_style_objects():
+    data = [[1, 2], [3, 4]]
+
+    # old style strings, names, and objects are interchangeable
+    ref = tt.to_string(data, style=tt.styles.thin_thick)
+    assert tt.to_string(data, style="─│┌┐└┘├┤┬┴┼┝━┿┥") == ref
+    assert tt.to_string(data, style="thin_thick") == ref
+    assert tt.styles.get("─│┌┐└┘├┤┬┴┼┝━┿┥") == tt.styles.thin_thick
+
+    style = tt.styles.ascii_thin.replace(
+        left="", right="", vertical=" ", inner_rules=False
+    )
+    tt.styles.register("plain", style)
+    assert tt.to_string(data, header=["a", "b"], style="plain") == "\n".join(
+        ["+---+---+", " a   b", "+---+---+", " 1   2", " 3   4", "+---+---+"]
+    )
+
+    # registering a name again replaces the style
+    tt.styles.register("plain", style.replace(horizontal="="))
+    assert tt.to_string(data, header=["a", "b"], style="plain").startswith("+===+")
+
+
+def test_render_line():
+    template = tt.Template([3, 4, 2], alignment="lcr", style=tt.styles.ascii_thin)
+    bold = "\x1b[1mx\x1b[0m"
+    line = template._render_line(["abc", bold, "日"], [3, 1, 2])
+    assert line == "| abc |  " + bold + "   | 日 |"
+
+    # trailing whitespace is only removed without a right border
+    template = tt.Template([3, 3], style=None)
+    assert template._render_line(["a", "b"], [1, 1]) == " a    b"
+
+
+def test_column_widths():
+    data = [["a", 1], ["bbb", 22]]
+    ref = tt.to_string([["a", 1], ["bbb", 22]], max_widths=[5, 4], min_widths=[5, 4])
+    assert tt.to_string(data, column_widths=[5, 4]) == ref
+
+    # cells that don't fit are wrapped
+    out = tt.to_string(data, column_widths=[2, 2], style=tt.styles.ascii_thin)
+    ref = "\n".join(
+        [
+            "+----+----+",
+            "| a  | 1  |",
+            "+----+----+",
+            "| bb | 22 |",
+            "| b  |    |",
+            "+----+----+",
+        ]
+    )
+    assert out == ref
+
+    # numeric arrays that don't fit leave the fast path
+    array = numpy.array([[1.5, 2.0], [3.0, 4.0]])
+    out = tt.to_string(array, column_widths=[2, 3], style=tt.styles.ascii_thin)
+    assert out.split("\n")[1:3] == ["| 1. | 2.0 |", "| 5  |     |"]
+
+
+def test_sticky_widths():
+    widths = tt.StickyWidths()
+    header = ["x", "y"]
+    data = [["a", 1], ["bbb", 22]]
+    assert tt.to_string(data, header, column_widths=widths) == tt.to_string(
+        data, header
+    )
+    assert widths.widths == [3, 2]
+
+    # the columns don't shrink ...
+    out = tt.to_string([["z", 1]], header, column_widths=widths)
+    assert out == tt.to_string([["z", 1]], header, max_widths=[3, 2], min_widths=[3, 2])
+    # ... but grow
+    out = tt.to_string([["zzzzz", 1]], header, column_widths=widths)
+    assert out == tt.to_string([["zzzzz", 1]], header, min_widths=[5, 2])
+    assert widths.widths == [5, 2]
+
+    # a different number of columns starts over
+    tt.to_string([[1, 2, 3]], column_widths=widths)
+    assert widths.widths == [1, 1, 1]
+
+
+def test_attributes():
+    Attributes = tt.ansi.Attributes
+    assert Attributes(fg="red", bold=True).code == "\x1b[1;31m"
+    assert Attributes(fg="bright_blue", bg=236).code == "\x1b[94;48;5;236m"
+    assert Attributes(fg=(1, 2, 3)).code == "\x1b[38;2;1;2;3m"
+    assert Attributes(fg="red").merge(Attributes(fg="blue", bold=True)) == Attributes(
+        fg="blue", bold=True
+    )
+
+    data = [["a", "1"], ["bb", "-2"], ["c", "3"]]
+    out = tt.to_string(
+        data,
+        header=["x", "y"],
+        alignment="lr",
+        style=tt.styles.ascii_thin,
+        column_attributes=[Attributes(bold=True), None],
+        row_attributes=[None, Attributes(bg=236)],
+        cell_attributes=lambda i, j, s: Attributes(fg="red") if "-" in s else None,
+    )
+    bold = "\x1b[1m"
+    stripe = "\x1b[48;5;236m"
+    reset = "\x1b[0m"
+    ref = "\n".join(
+        [
+            "+----+----+",
+            "| x  |  y |",
+            "+----+----+",
+            f"| {bold}a {reset} |  1 |",
+            "+----+----+",
+            f"| \x1b[1;48;5;236mbb{reset} | \x1b[31;48;5;236m-2{reset} |",
+            "+----+----+",
+            f"| {bold}c {reset} |  3 |",
+            "+----+----+",
+        ]
+    )
+    assert out == ref
+
+    # numeric arrays and functions of the row index
+    out = tt.to_string(
+        numpy.array([[1, 2], [3, 4]]),
+        style=None,
+        row_attributes=lambda i: Attributes(bg=236) if i == 1 else None,
+    )
+    assert out == f" 1  2\n {stripe}3{reset}  {stripe}4{reset}"